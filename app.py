@@ -1,9 +1,13 @@
 import streamlit as st
 
-from src.modules.basic_operations import run_basic_operations_module
-from src.modules.energy_power_signals import run_energy_power_module
-from src.modules.signals import run_signals_module
-from src.modules.convolution import run_convolution_module
+from src.modules.registry import (
+    PAGES,
+    import_report,
+    load_page,
+    warm_imports_in_background,
+)
+from src.ui.latency_panel import record_trace, render_latency_panel
+from src.utils.profiler import RerunProfiler, profile_stage
 
 st.set_page_config(layout="wide", page_title="CS Viz", menu_items={})
 
@@ -26,29 +30,48 @@ st.markdown(
 st.sidebar.markdown("## Comm. Systems Visualizer")
 st.sidebar.markdown("---")
 
-signal_topic = st.sidebar.radio(
-    "Signal Analysis",
-    [
-        "Signal Fundamentals",
-        "Basic Signal Operations",
-        "Energy and Power Signals",
-        "Convolution",
-    ],
-    key="signal_analysis",
-)
-digital_comm_topic = st.sidebar.radio(
-    "Digital Communication",
-    [
-        "Sampling Theorem",
-    ],
-    key="digital_comm",
+
+def _activate_section(section):
+    st.session_state["active_section"] = section
+
+
+# One radio per section; the section whose radio changed last is shown
+topics = {}
+for section, section_key in (
+    ("Signal Analysis", "signal_analysis"),
+    ("Frequency Domain", "frequency_domain"),
+    ("Digital Communication", "digital_comm"),
+    ("Channel & Noise", "channel_noise"),
+):
+    topics[section] = st.sidebar.radio(
+        section,
+        list(PAGES[section]),
+        key=section_key,
+        on_change=_activate_section,
+        args=(section,),
+    )
+
+active_section = st.session_state.get("active_section", "Signal Analysis")
+active_topic = topics[active_section]
+
+track_memory = st.sidebar.checkbox(
+    "Track allocations",
+    value=False,
+    help="Measure per-stage memory with tracemalloc (slows the page down)",
+    key="profiler_track_memory",
 )
+profiler = RerunProfiler(active_topic, track_memory=track_memory)
+
+with profiler.activate():
+    with profile_stage("load_page"):
+        run_page = load_page(active_section, active_topic)
+    if run_page is None:
+        st.info(f"{active_topic} is coming soon.")
+    else:
+        run_page()
+
+record_trace(profiler)
+render_latency_panel(profiler, import_report())
 
-if signal_topic == "Signal Fundamentals":
-    run_signals_module()
-if signal_topic == "Basic Signal Operations":
-    run_basic_operations_module()
-if signal_topic == "Energy and Power Signals":
-    run_energy_power_module()
-if signal_topic == "Convolution":
-    run_convolution_module()
+# The page is on screen; import everything else while the user reads it
+warm_imports_in_background()
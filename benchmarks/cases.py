@@ -0,0 +1,132 @@
+import numpy as np
+
+from src.core.convolution import convolve_sampled, iter_convolution_steps
+from src.core.signals import SIGNAL_REGISTRY
+from src.ui.plots import plot_signal
+from src.utils.time_axis import TimeAxis
+
+# Sweep grid: sampling rates up to the 50 kHz UI maximum, windows up to 10 s
+SAMPLING_RATES = (1, 10, 100, 1_000, 10_000, 50_000)
+WINDOW_LENGTHS = (0.1, 1.0, 10.0)
+
+QUICK_SAMPLING_RATES = (100, 10_000, 50_000)
+QUICK_WINDOW_LENGTHS = (1.0, 10.0)
+
+# stepwise_convolution is O(N²) over all frames; benchmark a fixed number of
+# animation frames from the middle of the output instead.
+STEPWISE_FRAMES = 200
+
+
+class Case:
+    """A named, parameterized benchmark: setup() builds inputs, run(inputs) is timed"""
+
+    def __init__(self, name, setup, run, n_samples):
+        self.name = name
+        self.setup = setup
+        self.run = run
+        self.n_samples = n_samples
+
+
+def _axis(fs, window):
+    return TimeAxis(t_min=-window / 2, t_max=window / 2, dt=1 / fs)
+
+
+def _evaluate_cases(fs, window):
+    axis = _axis(fs, window)
+    for key, factory in SIGNAL_REGISTRY.items():
+        yield Case(
+            f"evaluate/{key}/fs={fs}/T={window}",
+            setup=lambda factory=factory: (factory(), axis.generate()),
+            run=lambda inputs: inputs[0].evaluate(inputs[1]),
+            n_samples=len(axis),
+        )
+
+
+def _classify_cases(fs, window):
+    axis = _axis(fs, window)
+    for key in ("Sinusoidal", "rectangular", "unit_impulse"):
+        yield Case(
+            f"classify_signal/{key}/fs={fs}/T={window}",
+            setup=lambda key=key: SIGNAL_REGISTRY[key](),
+            run=lambda signal: signal.classify_signal(axis),
+            n_samples=len(axis),
+        )
+
+
+def _convolution_cases(fs, window):
+    axis = _axis(fs, window)
+
+    def setup():
+        t = axis.generate()
+        x = SIGNAL_REGISTRY["rectangular"]().evaluate(t)
+        h = SIGNAL_REGISTRY["exponential"](1.0, -1.0).evaluate(t)
+        return t, x, h
+
+    yield Case(
+        f"convolution/full/fs={fs}/T={window}",
+        setup=setup,
+        run=lambda inputs: convolve_sampled(*inputs, mode="full"),
+        n_samples=len(axis),
+    )
+
+    def run_stepwise(inputs):
+        _, x, h = inputs
+        middle = len(x) - 1
+        frames = range(
+            max(middle - STEPWISE_FRAMES // 2, 0), middle + STEPWISE_FRAMES // 2
+        )
+        for _ in iter_convolution_steps(x, h, frames):
+            pass
+
+    yield Case(
+        f"stepwise_convolution/{STEPWISE_FRAMES}-frames/fs={fs}/T={window}",
+        setup=setup,
+        run=run_stepwise,
+        n_samples=len(axis),
+    )
+
+
+def _plot_cases(fs, window):
+    axis = _axis(fs, window)
+
+    def setup():
+        t = axis.generate()
+        return t, SIGNAL_REGISTRY["Sinusoidal"]().evaluate(t)
+
+    for discrete in (False, True):
+        kind = "discrete" if discrete else "continuous"
+        yield Case(
+            f"plot_signal/{kind}/fs={fs}/T={window}",
+            setup=setup,
+            run=lambda inputs, discrete=discrete: plot_signal(
+                *inputs, discrete=discrete
+            ).to_json(),
+            n_samples=len(axis),
+        )
+
+
+def build_cases(quick=False):
+    """All benchmark cases for the sampling-rate x window-length sweep"""
+    rates = QUICK_SAMPLING_RATES if quick else SAMPLING_RATES
+    windows = QUICK_WINDOW_LENGTHS if quick else WINDOW_LENGTHS
+
+    cases = []
+    for fs in rates:
+        for window in windows:
+            if len(_axis(fs, window)) < 2:
+                continue
+            for make in (
+                _evaluate_cases,
+                _classify_cases,
+                _convolution_cases,
+                _plot_cases,
+            ):
+                cases.extend(make(fs, window))
+    return cases
+
+
+def warm_up():
+    """Trigger lazy imports and first-call costs outside the timed region"""
+    t = np.linspace(0, 1, 64)
+    plot_signal(t, t).to_json()
+    convolve_sampled(t, t, t)
@@ -0,0 +1,167 @@
+"""
+Benchmark runner for the signal, convolution and plotting hot paths.
+
+Usage (from the repository root):
+    python -m benchmarks.run                       # full sweep, print results
+    python -m benchmarks.run --quick --output out.json
+    python -m benchmarks.run --compare benchmarks/baselines/local.json
+
+Each repeat calls a case in a loop until it has run for at least
+--min-time seconds and records the time per call, so microsecond cases
+are measured as reliably as slow ones.
+
+With --compare, cases whose median time exceeds the baseline by more than
+--threshold (default 25%) and by more than --min-delta seconds (default
+0.5 ms) are reported and the exit status is 1.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from benchmarks.cases import build_cases, warm_up
+
+
+# Shortest time one repeat must take; faster cases are looped that long
+DEFAULT_MIN_TIME = 0.05
+
+# Smallest median slowdown (seconds) reported as a regression, whatever
+# the relative change; shorter differences are within timer and CI noise
+DEFAULT_MIN_DELTA = 0.5e-3
+
+
+def _loops_for(case, inputs, min_time):
+    # Like timeit.Timer.autorange: 1, 2, 5, 10, 20, 50, ... calls until a
+    # batch takes at least min_time
+    loops = 1
+    while True:
+        for factor in (1, 2, 5):
+            n = loops * factor
+            start = time.perf_counter()
+            for _ in range(n):
+                case.run(inputs)
+            if time.perf_counter() - start >= min_time:
+                return n
+        loops *= 10
+
+
+def time_case(case, repeat, min_time=DEFAULT_MIN_TIME):
+    inputs = case.setup()
+    loops = _loops_for(case, inputs, min_time)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            case.run(inputs)
+        timings.append((time.perf_counter() - start) / loops)
+
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "repeat": repeat,
+        "loops": loops,
+        "n_samples": case.n_samples,
+    }
+
+
+def run_benchmarks(quick=False, repeat=5, pattern=None, min_time=DEFAULT_MIN_TIME):
+    warm_up()
+    results = {}
+    for case in build_cases(quick=quick):
+        if pattern and pattern not in case.name:
+            continue
+        results[case.name] = time_case(case, repeat, min_time)
+        print(f"{case.name:<60} {results[case.name]['median'] * 1e3:10.3f} ms")
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "quick": quick,
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold, min_delta=DEFAULT_MIN_DELTA):
+    """
+    Return (name, baseline median, current median) for each case that is
+    both more than threshold (relative) and min_delta (seconds) slower
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        slowdown = result["median"] - base["median"]
+        if slowdown > base["median"] * threshold and slowdown > min_delta:
+            regressions.append((name, base["median"], result["median"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--quick", action="store_true", help="reduced sweep for CI")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filter", help="only run cases whose name contains this")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="allowed slowdown of the median before flagging (0.25 = 25%%)",
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=DEFAULT_MIN_DELTA,
+        help="also required absolute slowdown of the median, in seconds",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=DEFAULT_MIN_TIME,
+        help="loop each case for at least this many seconds per repeat",
+    )
+    args = parser.parse_args(argv)
+
+    current = run_benchmarks(
+        quick=args.quick,
+        repeat=args.repeat,
+        pattern=args.filter,
+        min_time=args.min_time,
+    )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+
+    if not args.compare:
+        return 0
+
+    with open(args.compare) as f:
+        baseline = json.load(f)
+
+    regressions = compare(current, baseline, args.threshold, args.min_delta)
+    for name, base, now in regressions:
+        print(f"REGRESSION {name}: {base * 1e3:.3f} ms -> {now * 1e3:.3f} ms")
+    if not regressions:
+        print(
+            f"No regressions beyond {args.threshold:.0%} and "
+            f"{args.min_delta * 1e3:g} ms of {args.compare}"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
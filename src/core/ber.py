@@ -0,0 +1,176 @@
+import numpy as np
+from scipy.special import erfc, ndtri
+
+from src.core.modulation import bits_per_symbol, detect, map_bits
+from src.core.parallel import POOL_WORKERS, get_executor
+
+# Symbols per vectorized batch; detection holds a (batch, M) distance matrix
+DEFAULT_BATCH_SYMBOLS = 1 << 16
+
+# Stop a point once the confidence interval is this narrow relative to the BER
+DEFAULT_RELATIVE_WIDTH = 0.2
+
+DEFAULT_MIN_ERRORS = 100
+DEFAULT_MAX_BITS = 10_000_000
+
+# Stop a point once its BER is shown to be below this; high-SNR points that
+# see no errors would otherwise run all max_bits
+DEFAULT_BER_FLOOR = 1e-6
+
+
+class BERPoint:
+    """Monte Carlo estimate of the bit error rate at one Eb/N0"""
+
+    def __init__(self, ebn0_db, errors, bits, confidence, converged, below_floor=False):
+        self.ebn0_db = ebn0_db
+        self.errors = errors
+        self.bits = bits
+        self.confidence = confidence
+        self.converged = converged  # False if max_bits was reached first
+        self.below_floor = below_floor  # Stopped at the upper bound < ber_floor
+
+    @property
+    def ber(self):
+        return self.errors / self.bits if self.bits else float("nan")
+
+    @property
+    def interval(self):
+        """Wilson score interval for the BER at the stored confidence"""
+        return wilson_interval(self.errors, self.bits, self.confidence)
+
+    def __repr__(self):
+        low, high = self.interval
+        return (
+            f"BERPoint(ebn0_db={self.ebn0_db}, ber={self.ber:.3g} "
+            f"[{low:.3g}, {high:.3g}], bits={self.bits})"
+        )
+
+
+def wilson_interval(errors, trials, confidence=0.95):
+    if trials == 0:
+        return 0.0, 1.0
+    z = ndtri(0.5 + confidence / 2)
+    p = errors / trials
+    denominator = 1 + z**2 / trials
+    center = (p + z**2 / (2 * trials)) / denominator
+    half_width = z * np.sqrt(p * (1 - p) / trials + z**2 / (4 * trials**2))
+    half_width /= denominator
+    return max(center - half_width, 0.0), min(center + half_width, 1.0)
+
+
+def theoretical_ber(modulation, ebn0_db):
+    """
+    Closed-form (exact for ASK/BPSK/QPSK, nearest-neighbour approximation
+    for 8PSK/16QAM) bit error rate over AWGN with Gray mapping.
+    """
+    ebn0 = 10 ** (np.asarray(ebn0_db, dtype=float) / 10)
+    k = bits_per_symbol(modulation)
+
+    if modulation in ("BPSK", "QPSK"):
+        return 0.5 * erfc(np.sqrt(ebn0))
+    if modulation == "ASK":
+        return 0.5 * erfc(np.sqrt(ebn0 / 2))
+    if modulation == "8PSK":
+        return erfc(np.sqrt(k * ebn0) * np.sin(np.pi / 8)) / k
+    if modulation == "16QAM":
+        return 3 / 8 * erfc(np.sqrt(0.4 * ebn0))
+    raise ValueError(f"no closed form for {modulation!r}")
+
+
+def simulate_ber_point(
+    modulation,
+    ebn0_db,
+    seed=None,
+    batch_symbols=DEFAULT_BATCH_SYMBOLS,
+    min_errors=DEFAULT_MIN_ERRORS,
+    relative_width=DEFAULT_RELATIVE_WIDTH,
+    max_bits=DEFAULT_MAX_BITS,
+    confidence=0.95,
+    ber_floor=DEFAULT_BER_FLOOR,
+):
+    """
+    Estimate the BER at one Eb/N0 over an AWGN channel.
+
+    Random bits are mapped to unit-energy symbols, complex Gaussian noise
+    with N0 = Eb / (Eb/N0) is added and the symbols are detected by
+    minimum distance, one vectorized batch at a time. Simulation stops
+    once at least min_errors errors were seen and the Wilson interval is
+    narrower than relative_width times the estimate, once the upper end of
+    the interval is below ber_floor (the point is then only bounded, not
+    estimated), or at max_bits.
+
+    Parameters:
+        seed : int, SeedSequence or None
+            Seed of this point's random stream
+
+    Returns:
+        BERPoint
+    """
+    rng = np.random.default_rng(seed)
+    k = bits_per_symbol(modulation)
+    noise_std = np.sqrt(1.0 / (k * 10 ** (ebn0_db / 10)) / 2)  # per component
+
+    errors = bits = 0
+    converged = below_floor = False
+    while bits < max_bits:
+        n_symbols = min(batch_symbols, -(-(max_bits - bits) // k))
+        tx_bits = rng.integers(0, 2, size=n_symbols * k, dtype=np.uint8)
+
+        received = map_bits(tx_bits, modulation)
+        received = received + noise_std * (
+            rng.standard_normal(n_symbols) + 1j * rng.standard_normal(n_symbols)
+        )
+
+        errors += int(np.count_nonzero(detect(received, modulation) != tx_bits))
+        bits += tx_bits.size
+
+        low, high = wilson_interval(errors, bits, confidence)
+        if errors >= min_errors and high - low <= relative_width * errors / bits:
+            converged = True
+            break
+        if high < ber_floor:
+            converged = below_floor = True
+            break
+
+    return BERPoint(ebn0_db, errors, bits, confidence, converged, below_floor)
+
+
+def _simulate_points(modulation, tasks, options):
+    # One pool task: several (Eb/N0, seed) points, simulated in turn
+    return [
+        simulate_ber_point(modulation, ebn0_db, child, **options)
+        for ebn0_db, child in tasks
+    ]
+
+
+def ber_curve(modulation, ebn0_db_values, seed=0, workers=None, **options):
+    """
+    BER at several Eb/N0 values, spread over at most `workers` pool tasks.
+
+    Every point gets an independent random stream spawned from
+    SeedSequence(seed), so results do not depend on the number of workers
+    or on scheduling. Options are passed on to simulate_ber_point.
+
+    Returns:
+        list of BERPoint in the order of ebn0_db_values
+    """
+    ebn0_db_values = [float(v) for v in ebn0_db_values]
+    tasks = list(
+        zip(ebn0_db_values, np.random.SeedSequence(seed).spawn(len(ebn0_db_values)))
+    )
+
+    workers = min(workers or POOL_WORKERS, POOL_WORKERS, len(tasks))
+    if workers <= 1:
+        return _simulate_points(modulation, tasks, options)
+
+    # Interleaved so every task gets a mix of fast low-SNR and slow
+    # high-SNR points
+    executor = get_executor()
+    futures = [
+        executor.submit(_simulate_points, modulation, tasks[i::workers], options)
+        for i in range(workers)
+    ]
+    points = [None] * len(tasks)
+    for i, future in enumerate(futures):
+        points[i::workers] = future.result()
+    return points
@@ -0,0 +1,110 @@
+import threading
+from collections import OrderedDict
+
+from src.utils.profiler import profiled
+
+# Default memory budget for cached arrays (bytes)
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+
+
+class SignalCache:
+    """
+    LRU cache of evaluated signals and generated time axes.
+
+    Entries are keyed by Signal.spec and TimeAxis.key, so a Streamlit rerun
+    that only toggles a plot option reuses the arrays from the previous run.
+    Least recently used entries are evicted once the stored arrays exceed
+    max_bytes. Cached arrays are read-only; copy them before modifying.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_bytes(self):
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value):
+        with self._lock:
+            self._max_bytes = value
+            self._evict()
+
+    def _evict(self):
+        while self.current_bytes > self._max_bytes and self._entries:
+            _, array = self._entries.popitem(last=False)
+            self.current_bytes -= array.nbytes
+            self.evictions += 1
+
+    def _get_or_compute(self, key, compute):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        # Compute outside the lock so other sessions are not blocked
+        array = compute()
+        array.setflags(write=False)
+
+        if array.nbytes > self._max_bytes:
+            return array
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = array
+                self.current_bytes += array.nbytes
+                self._evict()
+
+        return array
+
+    @profiled("time_axis")
+    def time_axis(self, axis):
+        """Cached equivalent of axis.generate()"""
+        return self._get_or_compute(("axis", axis.key), axis.generate)
+
+    @profiled("evaluate")
+    def evaluate(self, signal, axis):
+        """
+        Cached equivalent of signal.evaluate(axis.generate()).
+
+        Signals without a spec (algebra results) are evaluated every time.
+        """
+        spec = signal.spec
+        t = self._get_or_compute(("axis", axis.key), axis.generate)
+
+        if spec is None:
+            with self._lock:
+                self.misses += 1
+            return signal.evaluate(t)
+
+        return self._get_or_compute(
+            ("signal", spec, axis.key), lambda: signal.evaluate(t)
+        )
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+
+# Shared by all modules; Streamlit keeps imported modules alive across reruns.
+signal_cache = SignalCache()
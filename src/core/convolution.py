@@ -1,44 +1,510 @@
+import time
+
 import numpy as np
+from scipy import fft as sp_fft
 
+from src.utils.profiler import profiled
 
-def stepwise_convolution(x, h):
+CONVOLUTION_MODES = ("full", "same", "valid")
+CONVOLUTION_METHODS = ("auto", "direct", "fft", "overlap-add")
+
+# Rough relative cost of one FFT "butterfly" against one multiply-add of the
+# direct method. Only the ratio matters, it decides where the methods cross over.
+_FFT_COST_FACTOR = 4.0
+
+# Below this many multiply-adds np.convolve wins on call overhead alone.
+_DIRECT_MAX_OPS = 1 << 15
+
+
+class ConvolutionResult:
+    """Convolution output plus the bookkeeping needed to verify how it was made"""
+
+    def __init__(
+        self, y, mode, method, elapsed, full_length, offset, active_lengths=None
+    ):
+        self.y = y
+        self.mode = mode
+        # "direct", "fft", "overlap-add", or "impulse-shift" / "running-sum"
+        # for the exact fast paths of structured kernels
+        self.method = method
+        self.elapsed = elapsed  # seconds
+        self.full_length = full_length
+        self.offset = offset  # index of y[0] inside the "full" output
+        # (n_x, n_h) actually convolved after trimming zero regions, if trimmed
+        self.active_lengths = active_lengths
+
+    def __repr__(self):
+        return (
+            f"ConvolutionResult(mode={self.mode!r}, method={self.method!r}, "
+            f"len={self.y.size}, elapsed={self.elapsed * 1e3:.3f} ms)"
+        )
+
+
+def _fft_cost(n):
+    return _FFT_COST_FACTOR * n * np.log2(max(n, 2))
+
+
+def _ola_block_length(n_short):
+    """FFT length used per overlap-add block for a kernel of length n_short"""
+    return sp_fft.next_fast_len(8 * n_short, real=True)
+
+
+def choose_method(n_x, n_h):
     """
-    Compute stepwise convolution using the shift-and-dot-product logic.
+    Pick the cheapest convolution method for inputs of length n_x and n_h.
+
+    Uses a simple operation-count model:
+        direct       ~ n_x * n_h
+        fft          ~ 3 FFTs of length next_fast_len(n_x + n_h - 1)
+        overlap-add  ~ 2 FFTs per block of length ~8 * min(n_x, n_h)
+    """
+    n_long, n_short = max(n_x, n_h), min(n_x, n_h)
+    direct_cost = n_long * n_short
+
+    if n_short <= 1 or direct_cost <= _DIRECT_MAX_OPS:
+        return "direct"
+
+    n_full = sp_fft.next_fast_len(n_x + n_h - 1, real=True)
+    costs = {
+        "direct": direct_cost,
+        "fft": 3 * _fft_cost(n_full),
+    }
+
+    block_len = _ola_block_length(n_short)
+    if block_len < n_full:
+        n_blocks = -(-n_long // (block_len - n_short + 1))
+        costs["overlap-add"] = (2 * n_blocks + 1) * _fft_cost(block_len)
+
+    return min(costs, key=costs.get)
+
+
+def _fft_convolve(x, h):
+    n_full = x.size + h.size - 1
+    n_fast = sp_fft.next_fast_len(n_full, real=True)
+
+    if np.iscomplexobj(x) or np.iscomplexobj(h):
+        y = sp_fft.ifft(sp_fft.fft(x, n_fast) * sp_fft.fft(h, n_fast), n_fast)
+    else:
+        y = sp_fft.irfft(sp_fft.rfft(x, n_fast) * sp_fft.rfft(h, n_fast), n_fast)
+    return y[:n_full]
+
+
+def _overlap_add_convolve(x, h):
+    # Block the long input, convolve every block with the short kernel in one
+    # batched FFT, then add each block's tail onto the start of the next block.
+    if x.size < h.size:
+        x, h = h, x
+
+    n_x, n_h = x.size, h.size
+    n_full = n_x + n_h - 1
+    block_len = _ola_block_length(n_h)
+    step = block_len - n_h + 1
+    n_blocks = -(-n_x // step)
+
+    blocks = np.zeros((n_blocks, step), dtype=np.result_type(x, h))
+    blocks.reshape(-1)[:n_x] = x
+
+    if np.iscomplexobj(blocks):
+        spec = sp_fft.fft(blocks, block_len, axis=1) * sp_fft.fft(h, block_len)
+        segments = sp_fft.ifft(spec, block_len, axis=1)
+    else:
+        spec = sp_fft.rfft(blocks, block_len, axis=1) * sp_fft.rfft(h, block_len)
+        segments = sp_fft.irfft(spec, block_len, axis=1)
+
+    # block_len <= 2 * step, so a tail only ever spills into the next block
+    y = np.zeros((n_blocks + 1) * step, dtype=segments.dtype)
+    y[: n_blocks * step] += segments[:, :step].reshape(-1)
+
+    tails = np.zeros((n_blocks, step), dtype=segments.dtype)
+    tails[:, : n_h - 1] = segments[:, step:]
+    y[step:] += tails.reshape(-1)
+
+    return y[:n_full]
+
+
+def _mode_slice(n_x, n_h, mode):
+    """Offset and length of `mode` output inside the "full" output (np.convolve)"""
+    n_long, n_short = max(n_x, n_h), min(n_x, n_h)
+    if mode == "full":
+        return 0, n_long + n_short - 1
+    if mode == "same":
+        return (n_short - 1) // 2, n_long
+    if mode == "valid":
+        return n_short - 1, n_long - n_short + 1
+    raise ValueError(f"mode must be one of {CONVOLUTION_MODES}, got {mode!r}")
+
+
+def convolve(x, h, mode="full", method="auto"):
+    """
+    Linear convolution with automatic method selection.
+
+    The "full" result is computed once; "same" and "valid" are slices of it
+    with the same alignment as np.convolve.
+
+    Parameters:
+        x, h : array-like
+            Input signal and impulse response (1-D)
+        mode : str
+            "full", "same" or "valid"
+        method : str
+            "auto", "direct", "fft" or "overlap-add"
+
+    Returns:
+        ConvolutionResult
+    """
+    x = np.asarray(x)
+    h = np.asarray(h)
+
+    if x.ndim != 1 or h.ndim != 1:
+        raise ValueError("convolve expects 1-D inputs")
+    if x.size == 0 or h.size == 0:
+        raise ValueError("convolve inputs must not be empty")
+    if method not in CONVOLUTION_METHODS:
+        raise ValueError(f"method must be one of {CONVOLUTION_METHODS}, got {method!r}")
+
+    offset, length = _mode_slice(x.size, h.size, mode)
+
+    if method == "auto":
+        method = choose_method(x.size, h.size)
+
+    start = time.perf_counter()
+    if method == "direct":
+        y_full = np.convolve(x, h, mode="full")
+    elif method == "fft":
+        y_full = _fft_convolve(x, h)
+    else:
+        y_full = _overlap_add_convolve(x, h)
+    elapsed = time.perf_counter() - start
+
+    y = y_full[offset : offset + length]
+
+    return ConvolutionResult(
+        y=y,
+        mode=mode,
+        method=method,
+        elapsed=elapsed,
+        full_length=y_full.size,
+        offset=offset,
+    )
+
+
+def _kernel_index(value, t0, dt, n_full, rounding):
+    # Sample index of time `value` on an axis starting at t0; ±inf and far
+    # away values are clamped to just outside the output
+    position = (value - t0) / dt
+    return int(rounding(min(max(position, -n_full - 1.0), n_full + 1.0)))
+
+
+def structured_convolve(x, structure, t0, dt, n_h, mode="full"):
+    """
+    Exact convolution of samples with a structured kernel in O(N).
+
+    The kernel is described by Signal.structure instead of by samples:
+        ("dirac", tau, w)       y(t) = w · x(t - tau)              (a shift)
+        ("box", a, b, level)    y(t) = level · ∫ x over [t-b, t-a]  (difference
+                                of a cumulative sum; a step has b = inf)
+    The kernel is not truncated to its sample window, so e.g. x * u(t) is
+    the running integral of x over the whole output.
+
+    Parameters:
+        x : array-like
+            Samples of the other signal, spacing dt
+        structure : tuple
+            Kernel description (see Signal.structure)
+        t0, dt, n_h :
+            Start, spacing and length of the kernel's time axis, which fix
+            the output alignment exactly as for sampled kernels
+        mode : str
+            "full", "same" or "valid"
+
+    Returns:
+        ConvolutionResult, with y in continuous-time units (no dt factor)
+    """
+    x = np.asarray(x)
+    n_x = x.size
+    offset, length = _mode_slice(n_x, n_h, mode)
+    n_full = n_x + n_h - 1
+
+    start = time.perf_counter()
+    y_full = np.zeros(n_full, dtype=np.result_type(x, float))
+
+    if structure[0] == "dirac":
+        _, tau, weight = structure
+        method = "impulse-shift"
+        j = _kernel_index(tau, t0, dt, n_full, round)
+        lo, hi = max(j, 0), min(j + n_x, n_full)
+        if lo < hi:
+            y_full[lo:hi] = weight * x[lo - j : hi - j]
+    else:
+        _, a, b, level = structure
+        method = "running-sum"
+        j_lo = _kernel_index(a, t0, dt, n_full, lambda p: np.ceil(p - 1e-9))
+        j_hi = _kernel_index(b, t0, dt, n_full, lambda p: np.floor(p + 1e-9))
+        if j_lo <= j_hi:
+            # y[m] = level · dt · Σ x[m - j_hi .. m - j_lo]
+            csum = np.concatenate(([0], np.cumsum(x)))
+            m = np.arange(n_full)
+            window_sum = (
+                csum[np.clip(m - j_lo + 1, 0, n_x)] - csum[np.clip(m - j_hi, 0, n_x)]
+            )
+            y_full = level * dt * window_sum
+    elapsed = time.perf_counter() - start
+
+    return ConvolutionResult(
+        y=y_full[offset : offset + length],
+        mode=mode,
+        method=method,
+        elapsed=elapsed,
+        full_length=n_full,
+        offset=offset,
+    )
+
+
+def _axis_step(t):
+    return (t[-1] - t[0]) / (len(t) - 1) if len(t) > 1 else 1.0
+
+
+def active_support(x, threshold=0.0):
+    """
+    Index range [start, stop) outside which |x| <= threshold · max|x|.
+
+    With threshold=0 only exact zeros are trimmed, so convolving the active
+    ranges gives the same result as convolving the whole arrays.
+
+    Returns:
+        (start, stop), or None if no sample exceeds the threshold
+    """
+    magnitude = np.abs(np.asarray(x))
+    if magnitude.size == 0:
+        return None
+    active = np.flatnonzero(magnitude > threshold * magnitude.max())
+    if active.size == 0:
+        return None
+    return int(active[0]), int(active[-1]) + 1
+
+
+def _support_range(t, x, support, threshold):
+    # From factory metadata when known (padded by a sample against rounding
+    # at the edges), otherwise by scanning the samples
+    if support is None:
+        return active_support(x, threshold)
+
+    lo, hi = support
+    start = max(int(np.searchsorted(t, lo, side="left")) - 1, 0)
+    stop = min(int(np.searchsorted(t, hi, side="right")) + 1, len(t))
+    return (start, stop) if start < stop else None
+
+
+@profiled("convolve")
+def convolve_sampled(
+    t,
+    x,
+    h,
+    mode="full",
+    method="auto",
+    x_structure=None,
+    h_structure=None,
+    t_h=None,
+    x_support=None,
+    h_support=None,
+    threshold=0.0,
+):
+    """
+    Continuous-time convolution approximated from samples.
+
+    y(t) = ∫ x(τ) h(t - τ) dτ ≈ dt · Σ x[k] h[n - k]
+
+    Only the active parts of x and h are convolved, so the cost scales with
+    the pulse widths rather than the window. The output sample m lies at
+    t[0] + t_h[0] + m · dt in "full" mode.
+
+    Parameters:
+        t : ndarray
+            Uniform, increasing time axis of x
+        x, h : ndarray
+            Samples of the two signals
+        mode, method : str
+            See convolve()
+        x_structure, h_structure : tuple, optional
+            Signal.structure of the inputs; with method="auto" a structured
+            input is convolved exactly by structured_convolve()
+        t_h : ndarray, optional
+            Time axis of h if it differs from t (same spacing required)
+        x_support, h_support : tuple, optional
+            Signal.support of the inputs; if None the active part is found
+            by scanning for samples above `threshold`
+        threshold : float
+            Relative magnitude below which scanned samples count as zero
+
+    Returns:
+        t_out : ndarray
+            Time axis of the output
+        y : ndarray
+            Convolution samples (scaled by dt)
+        result : ConvolutionResult
+            Method and timing information
+    """
+    t = np.asarray(t)
+    t_h = t if t_h is None else np.asarray(t_h)
+    dt = _axis_step(t)
+    if len(t_h) > 1 and not np.isclose(_axis_step(t_h), dt, rtol=1e-9, atol=0):
+        raise ValueError("x and h must be sampled with the same spacing")
+
+    n_x, n_h = len(x), len(h)
+    offset, length = _mode_slice(n_x, n_h, mode)
+    n_full = n_x + n_h - 1
+
+    if method == "auto" and (x_structure or h_structure):
+        # Convolution commutes; make the structured input the kernel
+        t_kernel = t_h
+        if h_structure is None:
+            x, h, h_structure, t_kernel = h, x, x_structure, t
+        result = structured_convolve(x, h_structure, t_kernel[0], dt, len(h), mode)
+        y = result.y
+    else:
+        x_range = _support_range(t, x, x_support, threshold) or (0, 1)
+        h_range = _support_range(t_h, h, h_support, threshold) or (0, 1)
+        (i0, i1), (j0, j1) = x_range, h_range
+
+        part = convolve(x[i0:i1], h[j0:j1], mode="full", method=method)
+        y_full = np.zeros(n_full, dtype=part.y.dtype)
+        y_full[i0 + j0 : i0 + j0 + part.y.size] = part.y * dt
+
+        y = y_full[offset : offset + length]
+        result = ConvolutionResult(
+            y=y,
+            mode=mode,
+            method=part.method,
+            elapsed=part.elapsed,
+            full_length=n_full,
+            offset=offset,
+            active_lengths=(i1 - i0, j1 - j0),
+        )
+
+    t_out = t[0] + t_h[0] + dt * np.arange(offset, offset + y.size)
+
+    return t_out, y, result
+
+
+class ConvolutionStep:
+    """
+    One frame of the shift-multiply-sum view of y[n] = Σ x[k] h[n-k].
+
+    x_window and h_window are views into the inputs (h_window is reversed),
+    restricted to the overlap k_start <= k < k_stop; nothing is zero-padded.
+    """
+
+    def __init__(self, n, k_start, k_stop, x_window, h_window, product, value):
+        self.n = n  # output index / shift of the folded kernel
+        self.k_start = k_start
+        self.k_stop = k_stop
+        self.x_window = x_window
+        self.h_window = h_window
+        self.product = product  # x_window * h_window
+        self.value = value  # y[n]
+
+    def __repr__(self):
+        return (
+            f"ConvolutionStep(n={self.n}, overlap=[{self.k_start}, {self.k_stop}), "
+            f"value={self.value!r})"
+        )
+
+
+def convolution_step(x, h, n):
+    """
+    Compute a single frame of the step-by-step convolution in O(overlap).
 
     Parameters:
         x : array-like
             Input signal
         h : array-like
             Impulse response / filter
+        n : int
+            Output index, 0 <= n < len(x) + len(h) - 1 (negative counts from the end)
 
     Returns:
-        outputs : list
-            Stepwise convolution values (each shift result)
-        y_full : ndarray
-            Full convolution using np.convolve for verification
+        ConvolutionStep
     """
     x = np.asarray(x)
     h = np.asarray(h)
+    n_out = x.size + h.size - 1
+
+    if n < 0:
+        n += n_out
+    if not 0 <= n < n_out:
+        raise IndexError(f"step {n} out of range for {n_out} output samples")
+
+    # h[n - k] is non-zero only for 0 <= n - k < len(h)
+    k_start = max(0, n - h.size + 1)
+    k_stop = min(n, x.size - 1) + 1
+
+    x_window = x[k_start:k_stop]
+    # h[n - k_start], h[n - k_start - 1], ..., h[n - k_stop + 1] as a strided view
+    h_stop = n - k_stop
+    h_window = h[n - k_start : h_stop if h_stop >= 0 else None : -1]
+
+    product = x_window * h_window
+
+    return ConvolutionStep(
+        n=n,
+        k_start=k_start,
+        k_stop=k_stop,
+        x_window=x_window,
+        h_window=h_window,
+        product=product,
+        value=product.sum(),
+    )
+
 
-    n_x = len(x)
-    n_h = len(h)
-    n_out = n_x + n_h - 1  # length of convolution output
+def iter_convolution_steps(x, h, frames=None):
+    """
+    Lazily yield ConvolutionStep frames for a step-by-step animation.
 
-    outputs = []
+    Parameters:
+        x : array-like
+            Input signal
+        h : array-like
+            Impulse response / filter
+        frames : int, slice, range or iterable of int, optional
+            Which output indices to produce. Defaults to every index.
 
-    # Zero-pad input signal
-    x_padded = np.pad(x, (0, n_out - n_x))
+    Yields:
+        ConvolutionStep
+    """
+    x = np.asarray(x)
+    h = np.asarray(h)
+    n_out = x.size + h.size - 1
 
-    for i in range(n_out):
-        # Shift and pad h
-        h_shifted = np.zeros(n_out)
-        h_shifted[i : i + n_h] = h[: max(0, n_out - i)]
+    if frames is None:
+        frames = range(n_out)
+    elif isinstance(frames, slice):
+        frames = range(*frames.indices(n_out))
+    elif isinstance(frames, (int, np.integer)):
+        frames = (int(frames),)
 
-        # Stepwise convolution (dot product)
-        y_step = np.dot(x_padded, h_shifted)
-        outputs.append(y_step)
+    for n in frames:
+        yield convolution_step(x, h, n)
+
+
+def stepwise_convolution(x, h):
+    """
+    Compute stepwise convolution using the shift-and-dot-product logic.
+
+    Parameters:
+        x : array-like
+            Input signal
+        h : array-like
+            Impulse response / filter
+
+    Returns:
+        outputs : list
+            Stepwise convolution values (each shift result)
+        y_full : ndarray
+            Full convolution from the convolution engine for verification
+    """
+    outputs = [step.value for step in iter_convolution_steps(x, h)]
 
-    # Full convolution using numpy for verification
-    y_full = np.convolve(x, h, mode="full")
+    # Full convolution for verification
+    y_full = convolve(x, h, mode="full").y
 
     return outputs, y_full
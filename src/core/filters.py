@@ -0,0 +1,190 @@
+import functools
+
+import numpy as np
+from scipy import signal as sp_signal
+
+from src.core.convolution import convolve
+from src.core.spectral import DEFAULT_NPERSEG, StreamingWelch
+from src.core.statistics import DEFAULT_CHUNK_SIZE, StreamingMetrics
+
+FILTER_TYPES = ("lowpass", "highpass", "bandpass")
+FILTER_METHODS = ("iir", "fir")
+
+# FIR kernels longer than this are applied by FFT convolution instead of
+# lfilter's direct form
+FFT_FIR_TAPS = 64
+
+
+class FilterDesign:
+    """
+    Coefficients of a digital filter.
+
+    IIR filters are Butterworth designs stored as second-order sections
+    (numerically stable at high orders); FIR filters are windowed-sinc
+    (Hamming) designs with order + 1 taps.
+    """
+
+    def __init__(self, kind, method, order, cutoff, fs, sos=None, taps=None):
+        self.kind = kind
+        self.method = method
+        self.order = order
+        self.cutoff = cutoff
+        self.fs = fs
+        self.sos = sos
+        self.taps = taps
+
+    @property
+    def key(self):
+        return (self.kind, self.method, self.order, self.cutoff, self.fs)
+
+
+@functools.lru_cache(maxsize=64)
+def design_filter(kind, order, cutoff, fs, method="iir"):
+    """
+    Design (and cache) a low-, high- or band-pass filter.
+
+    Parameters:
+        kind : str
+            "lowpass", "highpass" or "bandpass"
+        order : int
+            IIR order, or FIR order (taps - 1; raised to even for highpass
+            and bandpass, which need a symmetric odd-length kernel)
+        cutoff : float or (float, float)
+            Cutoff frequency in Hz; (low, high) for bandpass
+        fs : float
+            Sampling frequency (Hz)
+        method : str
+            "iir" or "fir"
+
+    Returns:
+        FilterDesign with read-only coefficient arrays
+    """
+    if kind not in FILTER_TYPES:
+        raise ValueError(f"kind must be one of {FILTER_TYPES}, got {kind!r}")
+    if method not in FILTER_METHODS:
+        raise ValueError(f"method must be one of {FILTER_METHODS}, got {method!r}")
+
+    if method == "iir":
+        sos = sp_signal.butter(order, cutoff, btype=kind, fs=fs, output="sos")
+        sos.setflags(write=False)
+        return FilterDesign(kind, method, order, cutoff, fs, sos=sos)
+
+    numtaps = order + 1
+    if kind != "lowpass" and numtaps % 2 == 0:
+        numtaps += 1
+    taps = sp_signal.firwin(numtaps, cutoff, pass_zero=kind == "lowpass", fs=fs)
+    taps.setflags(write=False)
+    return FilterDesign(kind, method, numtaps - 1, cutoff, fs, taps=taps)
+
+
+class StreamingFilter:
+    """
+    Applies a FilterDesign to consecutive chunks of one signal, carrying
+    the filter state between them, so the output equals filtering the
+    concatenated input in one call (starting from rest).
+    """
+
+    def __init__(self, design):
+        self.design = design
+        self._state = None
+        # sosfilt needs a writable array; the cached design is read-only
+        self._sos = None if design.sos is None else np.array(design.sos)
+
+    @property
+    def uses_fft(self):
+        taps = self.design.taps
+        return taps is not None and taps.size > FFT_FIR_TAPS
+
+    def process(self, x):
+        x = np.asarray(x, dtype=float)
+        design = self.design
+
+        if self._sos is not None:
+            if self._state is None:
+                self._state = np.zeros((self._sos.shape[0], 2))
+            y, self._state = sp_signal.sosfilt(self._sos, x, zi=self._state)
+            return y
+
+        if not self.uses_fft:
+            if self._state is None:
+                self._state = np.zeros(design.taps.size - 1)
+            y, self._state = sp_signal.lfilter(design.taps, 1.0, x, zi=self._state)
+            return y
+
+        # Overlap-add: the last taps - 1 samples of each chunk's full
+        # convolution spill into the following chunks
+        if x.size == 0:
+            return x
+        full = convolve(x, design.taps, mode="full").y
+        if self._state is not None:
+            full[: self._state.size] += self._state
+        self._state = full[x.size :].copy()
+        return full[: x.size]
+
+    def reset(self):
+        self._state = None
+
+
+class FilteredSignal:
+    """
+    A Signal passed through a digital filter.
+
+    The filter is designed for the sampling rate of the axis it is
+    evaluated on and starts from rest at the first sample. Evaluation over
+    a TimeAxis streams chunk by chunk (iter_chunks, metrics, psd), so
+    arbitrarily long inputs are filtered in bounded memory.
+    """
+
+    def __init__(self, signal, kind, cutoff, order=4, method="iir"):
+        self.signal = signal
+        self.kind = kind
+        self.cutoff = tuple(cutoff) if np.ndim(cutoff) else float(cutoff)
+        self.order = int(order)
+        self.method = method
+        self.name = f"{kind} {method.upper()}({signal.name})"
+
+    @property
+    def formula(self):
+        cutoff = self.cutoff
+        if isinstance(cutoff, tuple):
+            band = f"{cutoff[0]:g}–{cutoff[1]:g} Hz"
+        else:
+            band = f"{cutoff:g} Hz"
+        return f"{self.kind}[{band}]{{{self.signal.formula}}}"
+
+    @property
+    def spec(self):
+        """Cache identity (the sampling rate is part of the axis key)"""
+        inner = self.signal.spec
+        if inner is None:
+            return None
+        return ("filter", self.kind, self.method, self.order, self.cutoff, inner)
+
+    def design(self, fs):
+        return design_filter(self.kind, self.order, self.cutoff, fs, self.method)
+
+    def evaluate(self, t):
+        """Filter the signal sampled on uniform times t (one block)"""
+        t = np.asarray(t, dtype=float)
+        fs = (t.size - 1) / (t[-1] - t[0]) if t.size > 1 else 1.0
+        return StreamingFilter(self.design(fs)).process(self.signal.evaluate(t))
+
+    def iter_chunks(self, axis, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Yield (sub_axis, filtered samples) over a TimeAxis with carried state"""
+        stream = StreamingFilter(self.design(1.0 / axis.step))
+        for chunk in axis.iter_chunks(chunk_size):
+            yield chunk, stream.process(self.signal.evaluate(chunk.generate()))
+
+    def metrics(self, axis, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Streaming energy, power, peak and RMS of the filtered output"""
+        reducer = StreamingMetrics(axis.step)
+        for _, y in self.iter_chunks(axis, chunk_size):
+            reducer.update(y)
+        return reducer.result()
+
+    def psd(self, axis, nperseg=DEFAULT_NPERSEG, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Welch PSD of the filtered output (see Signal.psd)"""
+        welch = StreamingWelch(1.0 / axis.step, nperseg=min(nperseg, len(axis)))
+        for _, y in self.iter_chunks(axis, chunk_size):
+            welch.update(y)
+        return welch.result()
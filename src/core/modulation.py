@@ -0,0 +1,261 @@
+import functools
+
+import numpy as np
+
+
+def _gray(n):
+    return n ^ (n >> 1)
+
+
+def _psk_table(m):
+    # Point i on the circle carries the Gray label of i
+    table = np.empty(m, dtype=complex)
+    table[_gray(np.arange(m))] = np.exp(2j * np.pi * np.arange(m) / m)
+    return table
+
+
+def _qam_table(m):
+    # Square QAM: Gray-coded PAM levels on each axis, unit average energy
+    side = int(round(np.sqrt(m)))
+    half_bits = side.bit_length() - 1
+    levels = np.empty(side)
+    levels[_gray(np.arange(side))] = 2 * np.arange(side) - (side - 1)
+
+    labels = np.arange(m)
+    table = levels[labels >> half_bits] + 1j * levels[labels & (side - 1)]
+    return table / np.sqrt(np.mean(np.abs(table) ** 2))
+
+
+# Symbol constellations with unit average energy. Row `label` holds the
+# point for the bits of `label` (most significant bit first).
+CONSTELLATIONS = {
+    "ASK": np.array([0.0, np.sqrt(2.0)], dtype=complex),  # on-off keying
+    "BPSK": np.array([-1.0, 1.0], dtype=complex),
+    "QPSK": _psk_table(4) * np.exp(1j * np.pi / 4),
+    "8PSK": _psk_table(8),
+    "16QAM": _qam_table(16),
+}
+for _table in CONSTELLATIONS.values():
+    _table.setflags(write=False)
+
+
+def get_modulations():
+    return tuple(CONSTELLATIONS)
+
+
+def bits_per_symbol(modulation):
+    return CONSTELLATIONS[modulation].size.bit_length() - 1
+
+
+@functools.lru_cache(maxsize=None)
+def _label_bits(k):
+    # Row `label` of this (2**k, k) table holds the bits of `label`
+    labels = np.arange(1 << k)
+    table = ((labels[:, None] >> np.arange(k - 1, -1, -1)) & 1).astype(np.uint8)
+    table.setflags(write=False)
+    return table
+
+
+def bits_to_labels(bits, k):
+    """Group bits (length a multiple of k) into symbol labels, MSB first"""
+    bits = np.asarray(bits, dtype=np.int64).reshape(-1, k)
+    return bits @ (1 << np.arange(k - 1, -1, -1))
+
+
+def map_bits(bits, modulation):
+    """Complex baseband symbols for a bit array (table lookup, no loops)"""
+    k = bits_per_symbol(modulation)
+    return CONSTELLATIONS[modulation][bits_to_labels(bits, k)]
+
+
+def detect(samples, modulation):
+    """
+    Minimum-distance detection of received samples back to bits.
+
+    Returns a uint8 array of len(samples) * bits_per_symbol(modulation).
+    """
+    table = CONSTELLATIONS[modulation]
+    samples = np.asarray(samples)
+    distance = np.abs(samples[:, None] - table[None, :]) ** 2
+    labels = np.argmin(distance, axis=1)
+    return _label_bits(bits_per_symbol(modulation))[labels].reshape(-1)
+
+
+# Passband keying
+# -------------------------------------------------
+# Constellation keyed onto the carrier for each scheme and order; FSK keys
+# the carrier frequency instead and has no constellation
+KEYING_SCHEMES = {
+    "ASK": {2: "ASK"},
+    "FSK": {2: None, 4: None},
+    "PSK": {2: "BPSK", 4: "QPSK", 8: "8PSK"},
+    "QAM": {16: "16QAM"},
+}
+
+# Symbol times are rounded by this (in symbols) so a sample that lands on a
+# boundary up to floating point error starts the new symbol
+_SYMBOL_EDGE_TOLERANCE = 1e-9
+
+
+@functools.lru_cache(maxsize=64)
+def keying_table(scheme, order, carrier, spacing=1.0):
+    """
+    Passband symbol for each label: (magnitude, phase, frequency) arrays.
+
+    Symbol `label` is magnitude · cos(2π·frequency·t + phase). ASK, PSK and
+    QAM take magnitude and phase from the unit-energy constellation on a
+    fixed carrier; FSK keys Gray-coded tones `spacing` Hz apart, centred on
+    the carrier. Each array has one extra entry (label `order`, magnitude 0)
+    used for times outside the burst.
+    """
+    if order not in KEYING_SCHEMES[scheme]:
+        orders = tuple(KEYING_SCHEMES[scheme])
+        raise ValueError(f"{scheme} order must be one of {orders}, got {order!r}")
+
+    frequency = np.full(order + 1, float(carrier))
+    if scheme == "FSK":
+        points = np.ones(order, dtype=complex)
+        frequency[_gray(np.arange(order))] += (
+            np.arange(order) - (order - 1) / 2
+        ) * spacing
+    else:
+        points = CONSTELLATIONS[KEYING_SCHEMES[scheme][order]]
+
+    magnitude = np.append(np.abs(points), 0.0)
+    phase = np.append(np.angle(points), 0.0)
+    for table in (magnitude, phase, frequency):
+        table.setflags(write=False)
+    return magnitude, phase, frequency
+
+
+@functools.lru_cache(maxsize=8)
+def random_bits(n_bits, seed=0):
+    """Reproducible bit stream (read-only uint8) for a seed"""
+    bits = np.random.default_rng(seed).integers(0, 2, size=n_bits, dtype=np.uint8)
+    bits.setflags(write=False)
+    return bits
+
+
+@functools.lru_cache(maxsize=8)
+def symbol_labels(n_bits, seed, k):
+    """
+    Labels of random_bits(n_bits, seed) in groups of k bits (the last group
+    zero-padded), framed by label 2**k on both sides for the silence
+    before and after the burst.
+    """
+    bits = random_bits(n_bits, seed)
+    padded = np.zeros(-(-n_bits // k) * k, dtype=np.uint8)
+    padded[:n_bits] = bits
+
+    silence = 1 << k
+    labels = np.full(padded.size // k + 2, silence, dtype=np.intp)
+    labels[1:-1] = bits_to_labels(padded, k)
+    labels.setflags(write=False)
+    return labels
+
+
+def _aligned_grid(t, period):
+    """
+    (first sample index, samples per symbol, step) if t is a uniform grid
+    with a whole number of samples per symbol whose samples fall on that
+    grid extended back to t = 0, else None.
+    """
+    if t.ndim != 1 or t.size < 2:
+        return None
+    step = (t[-1] - t[0]) / (t.size - 1)
+    if not step > 0:
+        return None
+
+    per_symbol = period / step
+    first = t[0] / step
+    if abs(per_symbol - round(per_symbol)) > 1e-9 * per_symbol or per_symbol < 0.5:
+        return None
+    if abs(first - round(first)) > 1e-6:
+        return None
+    spacing = np.subtract(t[1:], t[:-1])
+    spacing -= step
+    if max(spacing.max(), -spacing.min()) > 1e-6 * step:
+        return None
+    return int(round(first)), int(round(per_symbol)), step
+
+
+def _pulse_waveform(labels, magnitude, phase, frequency, first, n, per_symbol, step):
+    # Symbol m spans samples m * per_symbol + r. Its samples are
+    # Re{a_m · e^{j2πf·r·step}}, where the start phase 2πf·m·T is folded
+    # into a_m, so each symbol is the label's precomputed pulse row, scaled.
+    rows = np.arange(first // per_symbol, (first + n - 1) // per_symbol + 1)
+    symbols = labels[np.clip(rows + 1, 0, labels.size - 1)]
+    pulse = np.exp(2j * np.pi * frequency[:, None] * (np.arange(per_symbol) * step))
+
+    cycles = frequency * (per_symbol * step)
+    if np.allclose(cycles, np.round(cycles), rtol=0, atol=1e-12):
+        # Whole carrier cycles per symbol: every symbol of a label is the same
+        table = np.real(magnitude[:, None] * np.exp(1j * phase)[:, None] * pulse)
+        x = np.take(table, symbols, axis=0)
+    else:
+        start = np.mod(cycles[symbols] * rows, 1.0)
+        a = magnitude[symbols] * np.exp(1j * (2 * np.pi * start + phase[symbols]))
+        if np.all(frequency == frequency[0]):
+            # One carrier: broadcast its pulse instead of gathering rows
+            in_phase, quadrature = pulse.real[0], pulse.imag[0] * a.imag[:, None]
+        else:
+            in_phase = np.take(pulse.real, symbols, axis=0)
+            quadrature = np.take(pulse.imag, symbols, axis=0)
+            quadrature *= a.imag[:, None]
+        x = in_phase * a.real[:, None]
+        x -= quadrature
+
+    skip = first - rows[0] * per_symbol
+    return x.reshape(-1)[skip : skip + n]
+
+
+def keyed_waveform(
+    t,
+    scheme,
+    n_bits,
+    bit_rate,
+    carrier,
+    order=2,
+    spacing=1.0,
+    amplitude=1.0,
+    seed=0,
+):
+    """
+    Passband waveform of a keyed random bit stream, starting at t = 0.
+
+    On a uniform grid with a whole number of samples per symbol, each
+    symbol is a row copied from a per-label pulse table, scaled and
+    flattened. Any other grid (non-integer oversampling, non-uniform
+    times) looks up every sample's symbol by index instead. The signal is
+    0 outside [0, n_symbols / symbol_rate).
+    """
+    magnitude, phase, frequency = keying_table(scheme, order, carrier, spacing)
+    k = order.bit_length() - 1
+    labels = symbol_labels(n_bits, seed, k)
+
+    t = np.asarray(t, dtype=float)
+    aligned = _aligned_grid(t, k / bit_rate)
+    if aligned is not None:
+        first, per_symbol, step = aligned
+        x = _pulse_waveform(
+            labels, magnitude, phase, frequency, first, t.size, per_symbol, step
+        )
+        return x * amplitude if amplitude != 1.0 else x
+
+    index = t * (bit_rate / k)
+    index += 1.0 + _SYMBOL_EDGE_TOLERANCE  # labels[0] is the leading silence
+    np.floor(index, out=index)
+    np.clip(index, 0, labels.size - 1, out=index)
+    symbols = labels[index.astype(np.intp)]
+
+    if scheme == "FSK":
+        x = frequency[symbols] * t
+    else:
+        x = carrier * t
+    x *= 2 * np.pi
+    x += phase[symbols]
+    np.cos(x, out=x)
+    x *= magnitude[symbols]
+    if amplitude != 1.0:
+        x *= amplitude
+    return x
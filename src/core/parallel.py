@@ -0,0 +1,157 @@
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.core.plan import EvaluationPlan
+from src.core.signals import MODULATION_REGISTRY, SIGNAL_REGISTRY
+
+# Below this many samples per worker, process start-up and scheduling cost
+# more than they save; evaluate serially instead.
+MIN_SHARD_SIZE = 1 << 18
+
+# Size of the shared worker pool. Callers limit their own parallelism by
+# how many tasks they submit; the pool is never resized.
+POOL_WORKERS = os.cpu_count() or 1
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def plan_from_nodes(nodes):
+    """
+    Rebuild an EvaluationPlan from its node table (EvaluationPlan.key).
+
+    Leaves are re-created from SIGNAL_REGISTRY or MODULATION_REGISTRY, so
+    only plain data has to cross the process boundary, never closures.
+    """
+    funcs, params = {}, {}
+    for index, node in enumerate(nodes):
+        if node[0] != "leaf":
+            continue
+        kind, leaf_params = node[1], dict(node[2])
+        factory = SIGNAL_REGISTRY.get(kind) or MODULATION_REGISTRY.get(kind)
+        if factory is None:
+            raise ValueError(f"leaf {kind!r} is not a registry signal")
+        signal = factory(**leaf_params)
+        funcs[index], params[index] = signal.func, signal.params
+    return EvaluationPlan(nodes, funcs, params)
+
+
+def _evaluate_shard(nodes, shard_axis, shm_name, n_total, first):
+    # Runs in a worker: evaluate one contiguous shard straight into shared memory
+    plan = plan_from_nodes(nodes)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray((n_total,), dtype=np.float64, buffer=shm.buf)
+        out[first : first + len(shard_axis)] = plan.run(shard_axis.generate())
+        del out
+    finally:
+        shm.close()
+    return len(shard_axis)
+
+
+def _start_method():
+    # Forking a multi-threaded process (Streamlit serves each session from
+    # a thread) can deadlock the child, so workers are never forked
+    methods = multiprocessing.get_all_start_methods()
+    return "forkserver" if "forkserver" in methods else "spawn"
+
+
+def get_executor():
+    """
+    Shared ProcessPoolExecutor with POOL_WORKERS processes, created on
+    first use and kept until shutdown() (at interpreter exit).
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=POOL_WORKERS,
+                mp_context=multiprocessing.get_context(_start_method()),
+            )
+        return _executor
+
+
+def shutdown():
+    """Stop the worker pool (it is otherwise reused until interpreter exit)"""
+    global _executor
+
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+atexit.register(shutdown)
+
+
+def evaluate_parallel(signal, axis, workers=None, min_shard=MIN_SHARD_SIZE):
+    """
+    Evaluate `signal` over a TimeAxis using a reusable pool of processes.
+
+    The axis is split into one contiguous shard per worker; each worker
+    rebuilds the signal from its spec, generates its own slice of the time
+    axis and writes the samples into a shared-memory buffer, so no arrays
+    are pickled in either direction.
+
+    Shard samples are bit-identical to the full axis, but results match
+    serial evaluation only to within rounding: keyed sources (ASK, FSK,
+    PSK, QAM) check each shard on its own for the aligned pulse-table path
+    and take the grid step from its endpoints, so shards can differ from
+    the serial result in the last bits (about 1e-11).
+
+    Parameters:
+        signal : Signal
+            Any signal whose leaves come from SIGNAL_REGISTRY (spec is not None)
+        axis : TimeAxis
+            Time axis to evaluate on
+        workers : int, optional
+            Number of shards to evaluate at once (default and maximum:
+            POOL_WORKERS)
+        min_shard : int
+            Smallest shard worth sending to a worker
+
+    Returns:
+        ndarray of float64 samples
+    """
+    if signal.spec is None:
+        raise ValueError(
+            "parallel evaluation needs a signal built from registry factories"
+        )
+
+    n = len(axis)
+    workers = min(workers or POOL_WORKERS, POOL_WORKERS)
+    workers = max(1, min(workers, n // max(min_shard, 1)))
+    if workers == 1:
+        return np.asarray(signal.evaluate(axis.generate()), dtype=np.float64)
+
+    nodes = signal.compile().key
+    shard_size = -(-n // workers)
+
+    shm = shared_memory.SharedMemory(create=True, size=n * 8)
+    try:
+        executor = get_executor()
+        futures = [
+            executor.submit(
+                _evaluate_shard,
+                nodes,
+                axis[first : first + shard_size],
+                shm.name,
+                n,
+                first,
+            )
+            for first in range(0, n, shard_size)
+        ]
+        for future in futures:
+            future.result()
+
+        return np.ndarray((n,), dtype=np.float64, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
@@ -0,0 +1,180 @@
+import numpy as np
+
+# Samples processed per pass through the plan. Keeps every intermediate
+# buffer small enough to stay in cache, independent of the axis length.
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_BINARY_UFUNCS = {"add": np.add, "mul": np.multiply}
+
+
+def _compose(inner, outer):
+    """Affine map t -> inner(outer(t)) for maps given as (alpha, beta)"""
+    a_in, b_in = inner
+    a_out, b_out = outer
+    return a_in * a_out, a_in * b_out + b_in
+
+
+class EvaluationPlan:
+    """
+    Flat, common-subexpression-free program for evaluating a Signal tree.
+
+    Each node is one of
+        ("leaf", func_key, params, alpha, beta)   func(alpha * t + beta, **params)
+        ("add", i, j) / ("mul", i, j)             node_i (op) node_j
+        ("scale", i, factor)                      node_i * factor
+    and only refers to nodes before it, so running the nodes in order is a
+    valid schedule. Time transforms of inner sums/products are pushed down
+    into the leaves, so every leaf is evaluated directly on the input axis.
+    """
+
+    def __init__(self, nodes, funcs, params):
+        self.nodes = tuple(nodes)
+        self._funcs = funcs  # node index -> callable, for leaves
+        self._params = params  # node index -> params dict, for leaves
+        self._last_use = self._liveness()
+
+    @property
+    def key(self):
+        """Hashable identity of the computation (stable if all leaves are)"""
+        return self.nodes
+
+    def _liveness(self):
+        last_use = list(range(len(self.nodes)))
+        for index, node in enumerate(self.nodes):
+            if node[0] in _BINARY_UFUNCS:
+                last_use[node[1]] = index
+                last_use[node[2]] = index
+            elif node[0] == "scale":
+                last_use[node[1]] = index
+        return last_use
+
+    def _run_chunk(self, t, out):
+        values = [None] * len(self.nodes)
+        owned = [False] * len(self.nodes)  # buffer may be overwritten in place
+        time_grids = {(1.0, 0.0): t}
+        root = len(self.nodes) - 1
+
+        for index, node in enumerate(self.nodes):
+            op = node[0]
+            dest = out if index == root else None
+
+            if op == "leaf":
+                affine = node[3], node[4]
+                if affine not in time_grids:
+                    grid = np.multiply(t, affine[0])
+                    grid += affine[1]
+                    time_grids[affine] = grid
+                grid = time_grids[affine]
+
+                value = np.asarray(self._funcs[index](grid, **self._params[index]))
+                # Never hand a view of the time grid on as a writable buffer
+                is_own = value.shape == t.shape and not np.may_share_memory(value, grid)
+                if dest is not None:
+                    dest[...] = value
+                    value = dest
+                values[index], owned[index] = value, is_own
+                continue
+
+            a = values[node[1]]
+            if op == "scale":
+                b = node[2]
+                operands = (node[1],)
+            else:
+                b = values[node[2]]
+                operands = (node[1], node[2])
+
+            if dest is None:
+                # Reuse a dying operand's buffer when the result fits into it
+                for i in operands:
+                    if (
+                        owned[i]
+                        and self._last_use[i] == index
+                        and values[i].dtype == np.result_type(a, b)
+                    ):
+                        dest = values[i]
+                        break
+
+            ufunc = np.multiply if op == "scale" else _BINARY_UFUNCS[op]
+            if dest is None:
+                values[index] = ufunc(a, b)
+                owned[index] = values[index].shape == t.shape
+            else:
+                values[index] = ufunc(a, b, out=dest)
+                owned[index] = dest is not out
+
+            for i in operands:
+                if self._last_use[i] == index:
+                    values[i] = None
+
+        return values[root]
+
+    def run(self, t, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Evaluate the plan on time samples t in chunks of chunk_size"""
+        t = np.asarray(t, dtype=float)
+        if t.ndim != 1 or t.size <= chunk_size:
+            return np.asarray(self._run_chunk(t, None))
+
+        # The first chunk fixes the output dtype; later chunks write in place.
+        first = np.asarray(self._run_chunk(t[:chunk_size], None))
+        out = np.empty(t.shape, dtype=first.dtype)
+        out[:chunk_size] = first
+
+        for start in range(chunk_size, t.size, chunk_size):
+            stop = min(start + chunk_size, t.size)
+            self._run_chunk(t[start:stop], out[start:stop])
+
+        return out
+
+
+def compile_signal(signal):
+    """
+    Compile a Signal expression tree into an EvaluationPlan.
+
+    The tree is walked iteratively (no recursion limit). Structurally equal
+    subexpressions, such as the same leaf used twice, become one node.
+    """
+    nodes = []
+    funcs = {}
+    params = {}
+    index_of = {}  # node -> index, for common-subexpression elimination
+
+    def intern(node, func=None, leaf_params=None):
+        if node not in index_of:
+            index_of[node] = len(nodes)
+            nodes.append(node)
+            if func is not None:
+                funcs[index_of[node]] = func
+                params[index_of[node]] = leaf_params
+        return index_of[node]
+
+    # Work items: (signal, affine map of the plan input into its time axis)
+    stack = [(signal, (1.0, 0.0), False)]
+    results = []
+
+    while stack:
+        sig, outer, expanded = stack.pop()
+        affine = _compose(sig.affine, outer)
+
+        if sig.op is None:
+            func_key = sig.kind if sig.kind is not None else id(sig.func)
+            leaf_params = tuple(sorted(sig.params.items()))
+            node = ("leaf", func_key, leaf_params, float(affine[0]), float(affine[1]))
+            results.append(intern(node, sig.func, sig.params))
+            continue
+
+        if not expanded:
+            stack.append((sig, outer, True))
+            for operand in reversed(sig.operands):
+                stack.append((operand, affine, False))
+            continue
+
+        if sig.op == "scale":
+            child = results.pop()
+            results.append(intern(("scale", child, sig.params["factor"])))
+        else:
+            right = results.pop()
+            left = results.pop()
+            results.append(intern((sig.op, left, right)))
+
+    # The root is always interned last, so its result can go straight to out
+    return EvaluationPlan(nodes, funcs, params)
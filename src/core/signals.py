@@ -1,6 +1,16 @@
+import functools
 import re
+import threading
+from types import MappingProxyType
 
 import numpy as np
+from scipy.special import sici
+
+from src.core.modulation import keyed_waveform
+from src.core.plan import compile_signal
+from src.core.spectral import DEFAULT_NPERSEG, StreamingWelch, spectrum
+from src.core.statistics import DEFAULT_CHUNK_SIZE, running_power, stream_metrics
+from src.utils.time_axis import TimeAxis
 
 
 # Compatibility helper: some NumPy builds may not expose `np.trapz`.
@@ -17,94 +27,329 @@ def _trapz(y, x):
         return np.sum((y[:-1] + y[1:]) * 0.5 * dx)
 
 
+ENERGY_METHODS = ("auto", "analytic", "numeric")
+
+# Largest time grid kept in the per-thread scratch buffer; longer grids are
+# transformed into a fresh array so a single huge evaluation does not pin
+# its memory for the rest of the session.
+SCRATCH_MAX_SAMPLES = 1 << 20
+
+# Per-thread work array and whether an evaluation is using it right now
+_scratch = threading.local()
+
+
+def _scratch_buffer(n):
+    """Reusable float64 work array of length n for the calling thread"""
+    buffer = getattr(_scratch, "buffer", None)
+    if buffer is None or buffer.size < n:
+        buffer = np.empty(n)
+        _scratch.buffer = buffer
+    return buffer[:n]
+
+
+def _structure_in_t(structure, alpha, beta):
+    """Map a structure given in u = alpha * t + beta back to t"""
+    if structure is None or alpha == 0:
+        return None
+
+    if structure[0] == "dirac":
+        # δ(αt + β) = δ(t - t0) / |α|
+        _, u0, weight = structure
+        return ("dirac", (u0 - beta) / alpha, weight / abs(alpha))
+
+    _, lo, hi, level = structure
+    lo, hi = sorted(((lo - beta) / alpha, (hi - beta) / alpha))
+    return ("box", lo, hi, level)
+
+
+def _interval_in_t(interval, alpha, beta):
+    """Map an interval of u = alpha * t + beta back to t"""
+    if interval is None:
+        return None
+    if alpha == 0:
+        # Constant argument: either everywhere or nowhere, not a bounded support
+        return None
+    lo, hi = interval
+    return tuple(sorted(((lo - beta) / alpha, (hi - beta) / alpha)))
+
+
+def _window(t):
+    """First and last sample time of a sample array or TimeAxis"""
+    if isinstance(t, TimeAxis):
+        return t.start, t.stop
+    return float(t[0]), float(t[-1])
+
+
 class Signal:
-    """Core Signal Class"""
+    """
+    Core Signal Class
+
+    Signals are immutable: time_shift, time_scale and fold return a new
+    Signal that shares func, params and operands with the original, so
+    transformed variants are O(1) to create and never need copying.
+    """
+
+    __slots__ = (
+        "func",
+        "name",
+        "_base_formula",
+        "params",
+        "kind",
+        "sq_integral",
+        "_structure",
+        "_support",
+        "op",
+        "operands",
+        "_alpha",
+        "_beta",
+        "_plan",
+    )
 
-    def __init__(self, func, name, formula, params=None):
+    def __init__(
+        self,
+        func,
+        name,
+        formula,
+        params=None,
+        kind=None,
+        op=None,
+        operands=(),
+        sq_integral=None,
+        structure=None,
+        support=None,
+    ):
         self.func = func
         self.name = name
         self._base_formula = formula
-        self.params = params or {}
+        # Read-only, so derived signals can share it safely
+        self.params = MappingProxyType(dict(params or {}))
+        self.kind = kind  # registry key of the factory that built it
+
+        # Optional closed form of ∫ |func(u)|² du: sq_integral(lo, hi, **params)
+        self.sq_integral = sq_integral
 
-        # Transformation state
-        self._time_shift = 0.0  # τ
-        self._time_scale = 1.0  # a
-        self._fold = False  # x(-t)
+        # Optional exact shape of func in u: ("dirac", u0, weight) or
+        # ("box", lo, hi, level); a step is a box with an infinite edge
+        self._structure = structure
+
+        # Optional interval of u outside which func is exactly zero
+        self._support = support
+
+        # Expression tree: op is None for leaves, else "add", "mul" or "scale"
+        self.op = op
+        self.operands = tuple(operands)
+
+        # Transformation state: x(t) = func(alpha * t + beta)
+        self._alpha = 1.0
+        self._beta = 0.0
+
+        self._plan = None  # compiled EvaluationPlan, built on first use
 
     @property
     def formula(self):
         """Dynamic formula reflecting transformations"""
-        t_str = "t"
-
-        # Fold (inversion)
-        if self._fold:
-            t_str = f"-{t_str}"  # no extra parentheses if not needed
+        alpha, beta = self._alpha, self._beta
 
-        # Time scale
-        if self._time_scale != 1.0:
-            t_str = f"{self._time_scale}*{t_str}"
+        # Time scale and inversion
+        if alpha == 1.0:
+            t_str = "t"
+        elif alpha == -1.0:
+            t_str = "-t"  # no extra parentheses if not needed
+        else:
+            t_str = f"{alpha}*t"
 
         # Time shift
-        if self._time_shift != 0.0:
-            sign = "-" if self._time_shift > 0 else "+"
-            t_str = f"{t_str}{sign}{abs(self._time_shift)}"
+        if beta != 0.0:
+            sign = "+" if beta > 0 else "-"
+            t_str = f"{t_str}{sign}{abs(beta)}"
 
         # Replace standalone t in base formula
         formula_str = re.sub(r"\bt\b", t_str, self._base_formula)
 
         return f"{formula_str}"
 
-    def evaluate(self, t):
-        # shift
-        t_shifted = t - self._time_shift
+    @property
+    def affine(self):
+        """Transformation state as the map t -> alpha * t + beta"""
+        return self._alpha, self._beta
+
+    @property
+    def structure(self):
+        """
+        Exact description of this signal in t, or None.
+
+        ("dirac", t0, weight)    weight · δ(t - t0)
+        ("box", lo, hi, level)   level on [lo, hi], 0 elsewhere (lo/hi may be ±inf)
+
+        Known for impulse, step and rectangular factories, and for scalar
+        multiples of them; convolution uses it for exact O(N) fast paths.
+        """
+        if self.op is None:
+            structure = self._structure
+        elif self.op == "scale":
+            structure = self.operands[0].structure
+            if structure is not None:
+                factor = self.params["factor"]
+                structure = structure[:-1] + (structure[-1] * factor,)
+        else:
+            return None
+
+        # A composite's transform applies to the time axis of its operand
+        return _structure_in_t(structure, self._alpha, self._beta)
+
+    @property
+    def support(self):
+        """
+        Interval (lo, hi) in t outside which the signal is exactly zero, or
+        None if unknown or unbounded on both sides. Ends may be ±inf.
+        """
+        if self.op is None:
+            support = self._support
+        elif self.op == "scale":
+            support = self.operands[0].support
+        else:
+            left, right = (operand.support for operand in self.operands)
+            if self.op == "add":
+                # Union hull: unknown if either side is unknown
+                support = None
+                if left is not None and right is not None:
+                    support = (min(left[0], right[0]), max(left[1], right[1]))
+            else:
+                # Product vanishes wherever either factor does
+                if left is None or right is None:
+                    support = left or right
+                else:
+                    support = (max(left[0], right[0]), min(left[1], right[1]))
+
+        return _interval_in_t(support, self._alpha, self._beta)
 
-        # time scale
-        t_scaled = self._time_scale * t_shifted
+    @property
+    def spec(self):
+        """
+        Hashable description of this signal (factory, params, transforms).
+
+        None if any leaf was not built by a registry factory, since closures
+        cannot be compared.
+        """
+        if self.op is not None:
+            plan = self.compile()
+            leaves = (node for node in plan.nodes if node[0] == "leaf")
+            if any(not isinstance(leaf[1], str) for leaf in leaves):
+                return None
+            return plan.key
+
+        if self.kind is None:
+            return None
+
+        return (
+            self.kind,
+            tuple(sorted(self.params.items())),
+            self._alpha,
+            self._beta,
+        )
 
-        # fold
-        if self._fold:
-            t_final = -t_scaled
+    def compile(self):
+        """Flatten this expression tree into an EvaluationPlan (cached)"""
+        if self._plan is None:
+            self._plan = compile_signal(self)
+        return self._plan
+
+    def evaluate(self, t):
+        if self.op is not None:
+            return self.compile().run(t)
+
+        alpha, beta = self._alpha, self._beta
+        if alpha == 1.0 and beta == 0.0:
+            return self.func(t, **self.params)
+
+        # alpha * t + beta in one pass, into the thread's scratch buffer.
+        # The buffer is not reentrant: if func evaluates another Signal on
+        # this thread, that inner call finds it busy and allocates instead.
+        t = np.asarray(t, dtype=float)
+        scratch = t.size <= SCRATCH_MAX_SAMPLES and not getattr(_scratch, "busy", False)
+        u = _scratch_buffer(t.size).reshape(t.shape) if scratch else None
+        if alpha == 1.0:
+            u = np.add(t, beta, out=u)
         else:
-            t_final = t_scaled
+            u = np.multiply(t, alpha, out=u)
+            if beta != 0.0:
+                u += beta
+
+        if not scratch:
+            return self.func(u, **self.params)
+
+        _scratch.busy = True
+        try:
+            x = self.func(u, **self.params)
+        finally:
+            _scratch.busy = False
+        if np.may_share_memory(x, u):
+            # func returned its input or a view of it (e.g. lambda t: t), which
+            # the next evaluation on this thread would overwrite
+            x = np.array(x)
+        return x
+
+    # Immutable, so copies can be the object itself. Also keeps deepcopy
+    # working (the read-only params mapping cannot be pickled).
+    def __copy__(self):
+        return self
 
-        return self.func(t_final, **self.params)
+    def __deepcopy__(self, memo):
+        return self
 
     # -------- Transformations --------
+    # Each transform is applied to the time axis seen by the signal so far:
+    # the result is always x(±a(t - τ)) with the scales multiplied, the
+    # shifts added and the inversions toggled, whatever the call order.
+    def _derive(self, alpha, beta):
+        # Shallow view: everything is shared except the transformation state
+        derived = object.__new__(Signal)
+        for slot in Signal.__slots__:
+            setattr(derived, slot, getattr(self, slot))
+        derived._alpha = alpha
+        derived._beta = beta
+        derived._plan = None
+        return derived
+
     def time_shift(self, tau):
-        self._time_shift += tau
-        return self
+        return self._derive(self._alpha, self._beta - self._alpha * tau)
 
     def time_scale(self, a):
-        self._time_scale *= a
-        return self
+        return self._derive(self._alpha * a, self._beta * a)
 
     def fold(self):
-        self._fold = not self._fold
-        return self
+        return self._derive(-self._alpha, -self._beta)
 
     # -------- Algebra --------
     def __add__(self, other):
         return Signal(
-            lambda t: self.evaluate(t) + other.evaluate(t),
+            None,
             name=f"({self.name}+{other.name})",
             formula=f"({self.formula}) + ({other.formula})",
+            op="add",
+            operands=(self, other),
         )
 
     def __mul__(self, other):
         # Support scalar multiplication and Signal * Signal
         if isinstance(other, (int, float, np.number)):
             return Signal(
-                lambda t: self.evaluate(t) * other,
+                None,
                 name=f"({self.name}*{other})",
                 formula=f"{other}·({self.formula})",
+                params={"factor": other},
+                op="scale",
+                operands=(self,),
             )
 
         # Signal * Signal
         if isinstance(other, Signal):
             return Signal(
-                lambda t: self.evaluate(t) * other.evaluate(t),
+                None,
                 name=f"({self.name}*{other.name})",
                 formula=f"({self.formula}) · ({other.formula})",
+                op="mul",
+                operands=(self, other),
             )
 
         return NotImplemented
@@ -114,34 +359,137 @@ class Signal:
         return self.__mul__(other)
 
     # ---------------- Energy & Power ----------------
-    def energy(self, t):
+    def metrics(self, axis, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Energy, power, peak and RMS over a TimeAxis in a single streaming
+        pass with compensated summation (constant memory).
+        """
+        return stream_metrics(self, axis, chunk_size)
+
+    def analytic_energy(self, t_start, t_end):
+        """
+        Exact ∫ |x(t)|² dt over [t_start, t_end] from the factory's closed
+        form, or None if there is none (algebra results, unit impulse).
+
+        With x(t) = f(αt + β), the integral is (1/|α|) ∫ |f(u)|² du over
+        the image of [t_start, t_end].
+        """
+        if self.op is not None or self.sq_integral is None:
+            return None
+
+        alpha, beta = self.affine
+        if alpha == 0:
+            return None
+
+        u_start, u_end = alpha * t_start + beta, alpha * t_end + beta
+        lo, hi = min(u_start, u_end), max(u_start, u_end)
+        return float(self.sq_integral(lo, hi, **self.params)) / abs(alpha)
+
+    def _exact_energy(self, t, method):
+        if method not in ENERGY_METHODS:
+            raise ValueError(f"method must be one of {ENERGY_METHODS}, got {method!r}")
+        if method == "numeric":
+            return None
+
+        E = self.analytic_energy(*_window(t))
+        if E is None and method == "analytic":
+            raise ValueError(f"{self.name} has no closed-form energy")
+        return E
+
+    def energy(self, t, method="auto"):
         """
         Discrete approximation of signal energy:
         E = ∫ |x(t)|² dt
+
+        t may be a sample array or a TimeAxis (streamed in chunks).
+        method: "auto" uses the closed form when the signal has one,
+        "analytic" requires it, "numeric" always integrates the samples.
         """
+        E = self._exact_energy(t, method)
+        if E is not None:
+            return E
+
+        if isinstance(t, TimeAxis):
+            return self.metrics(t).energy
+
         x = self.evaluate(t)
         # Use robust trapezoidal integration (fallback if np.trapz unavailable)
         return _trapz(np.abs(x) ** 2, t)
 
-    def power(self, t):
+    def power(self, t, method="auto"):
         """
         Discrete approximation of average power:
         P = lim(T→∞) (1/2T) ∫ |x(t)|² dt
         Approximated by time average.
+
+        t may be a sample array or a TimeAxis (streamed in chunks).
+        method: see energy().
         """
+        E = self._exact_energy(t, method)
+        if E is not None:
+            t_start, t_end = _window(t)
+            T = t_end - t_start
+            return E / T if T != 0 else 0.0
+
+        if isinstance(t, TimeAxis):
+            return self.metrics(t).power
+
         x = self.evaluate(t)
         T = t[-1] - t[0]
         if T == 0:
             return 0.0
         return (1 / T) * _trapz(np.abs(x) ** 2, t)
 
-    def classify_signal(self, t):
-        E = self.energy(t)
+    def running_power(self, t, windows):
+        """
+        Sliding-window average of |x(t)|² for one or more window lengths
+        (in samples), each in O(N) via re-anchored cumulative sums.
+
+        Returns a dict mapping window length -> running power.
+        """
+        return running_power(self.evaluate(np.asarray(t)), windows)
 
-        P = self.power(t)
+    def running_rms(self, t, windows):
+        """Square root of running_power for each window length"""
+        return {w: np.sqrt(p) for w, p in self.running_power(t, windows).items()}
+
+    # ---------------- Spectrum ----------------
+    def spectrum(self, axis):
+        """
+        Fourier transform X(f), f >= 0, of the signal sampled on a TimeAxis
+        (see spectral.spectrum). Returns a Spectrum.
+        """
+        x = self.evaluate(axis.generate())
+        return spectrum(x, 1.0 / axis.step, t0=axis.start)
+
+    def psd(self, axis, nperseg=DEFAULT_NPERSEG, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Welch power spectral density over a TimeAxis, evaluated chunk by
+        chunk so memory stays bounded for any number of samples.
+        nperseg is clipped to the axis length. Returns a Spectrum.
+        """
+        welch = StreamingWelch(1.0 / axis.step, nperseg=min(nperseg, len(axis)))
+        for chunk in axis.iter_chunks(chunk_size):
+            welch.update(self.evaluate(chunk.generate()))
+        return welch.result()
+
+    def classify_signal(self, t, method="auto"):
+        # Closed form when available, else energy and power from one evaluation
+        E = self._exact_energy(t, method)
+        if E is not None:
+            t_start, t_end = _window(t)
+            T = t_end - t_start
+            P = E / T if T != 0 else 0.0
+        elif isinstance(t, TimeAxis):
+            metrics = self.metrics(t)
+            E, P, T = metrics.energy, metrics.power, metrics.duration
+        else:
+            x = self.evaluate(t)
+            E = _trapz(np.abs(x) ** 2, t)
+            T = t[-1] - t[0]
+            P = E / T if T != 0 else 0.0
 
         # Check if energy saturates (energy signal) vs grows linearly (power signal)
-        T = t[-1] - t[0]
         if E < 1e3 and P < 1e-3:
             return "Zero Signal", E, P
 
@@ -153,14 +501,109 @@ class Signal:
             return "Energy Signal", E, P
 
 
+# Closed-form energy integrals ∫_lo^hi |f(u)|² du of the factory functions
+# -----------------------------------------------------------------------
+
+
+def _step_sq_integral(lo, hi, constant):
+    return constant**2 * max(hi - max(lo, 0.0), 0.0)
+
+
+def _ramp_sq_integral(lo, hi):
+    lo = max(lo, 0.0)
+    return (hi**3 - lo**3) / 3 if hi > lo else 0.0
+
+
+def _exponential_sq_integral(lo, hi, c, a):
+    lo = max(lo, 0.0)
+    if hi <= lo:
+        return 0.0
+    if a == 0:
+        return c**2 * (hi - lo)
+    return c**2 * (np.exp(2 * a * hi) - np.exp(2 * a * lo)) / (2 * a)
+
+
+def _sinusoid_sq_integral(lo, hi, amplitude, frequency, phase):
+    # sin²(θ) = (1 - cos 2θ) / 2
+    omega = 2 * np.pi * frequency
+    if omega == 0:
+        return amplitude**2 * np.sin(phase) ** 2 * (hi - lo)
+    oscillation = np.sin(2 * omega * hi + 2 * phase) - np.sin(
+        2 * omega * lo + 2 * phase
+    )
+    return amplitude**2 / 2 * ((hi - lo) - oscillation / (2 * omega))
+
+
+def _sinc_sq_antiderivative(u):
+    # d/du [Si(2πu)/π - sin²(πu)/(π²u)] = sin²(πu)/(πu)²
+    if u == 0:
+        return 0.0
+    return sici(2 * np.pi * u)[0] / np.pi - np.sin(np.pi * u) ** 2 / (np.pi**2 * u)
+
+
+def _sinc_sq_integral(lo, hi, amplitude):
+    return amplitude**2 * (_sinc_sq_antiderivative(hi) - _sinc_sq_antiderivative(lo))
+
+
+def _signum_sq_integral(lo, hi):
+    return hi - lo
+
+
+def _rect_sq_integral(lo, hi, start, end, amplitude):
+    return amplitude**2 * max(min(hi, end) - max(lo, start), 0.0)
+
+
+def _tri_sq_antiderivative(v):
+    # ∫_0^v (1 - |x|)² dx for the unit triangle, constant outside [-1, 1]
+    v = min(max(v, -1.0), 1.0)
+    return np.sign(v) * (1 - (1 - abs(v)) ** 3) / 3
+
+
+def _tri_sq_integral(lo, hi, start, end, amplitude):
+    # Substitute v = 2(u - start)/(end - start) - 1, du = (end - start)/2 dv
+    half_width = (end - start) / 2
+    v_lo = (lo - start) / half_width - 1
+    v_hi = (hi - start) / half_width - 1
+    return (
+        amplitude**2
+        * half_width
+        * (_tri_sq_antiderivative(v_hi) - _tri_sq_antiderivative(v_lo))
+    )
+
+
 # Signal Factory Functions
 # -----------------------------------------------------------------------
 
 
+def _impulse_samples(t):
+    """
+    1 at the sample nearest to t = 0, 0 elsewhere.
+
+    A sample t[i] is "nearest" when it lies in (-h/2, h/2] for the local
+    spacing h, so exactly one sample of a uniform grid is hit, also when
+    the grid is evaluated in chunks or does not contain 0 exactly.
+    """
+    t = np.asarray(t, dtype=float)
+    flat = t.reshape(-1)
+    if flat.size < 2:
+        return np.where(np.isclose(t, 0), 1.0, 0.0)
+
+    x = np.zeros(flat.size)
+    i = int(np.argmin(np.abs(flat)))
+    neighbour = i + 1 if i + 1 < flat.size else i - 1
+    half_step = abs(flat[neighbour] - flat[i]) / 2
+    if -half_step < flat[i] <= half_step:
+        x[i] = 1.0
+    return x.reshape(t.shape)
+
+
 def unit_impulse():
     return Signal(
-        func=lambda t: np.where(np.isclose(t, 0), 1.0, 0.0),
+        func=_impulse_samples,
         name="Unit Impulse",
+        kind="unit_impulse",
+        structure=("dirac", 0.0, 1.0),
+        support=(0.0, 0.0),
         formula="δ(t)",
     )
 
@@ -169,6 +612,10 @@ def unit_step(constant=1.0):
     return Signal(
         func=lambda t, constant=constant: np.where(t >= 0, constant, 0.0),
         name="Unit Step",
+        kind="unit_step",
+        sq_integral=_step_sq_integral,
+        structure=("box", 0.0, np.inf, constant),
+        support=(0.0, np.inf),
         formula="u(t)",
         params={"constant": constant},
     )
@@ -178,6 +625,9 @@ def ramp():
     return Signal(
         func=lambda t: np.where(t >= 0, t, 0.0),
         name="Ramp",
+        kind="ramp",
+        sq_integral=_ramp_sq_integral,
+        support=(0.0, np.inf),
         formula="t × u(t)",
     )
 
@@ -186,8 +636,11 @@ def exponential(c=1.0, a=1.0):
     return Signal(
         func=lambda t, c=c, a=a: c * np.exp(a * t) * (t >= 0),
         name="Exponential",
+        kind="exponential",
+        sq_integral=_exponential_sq_integral,
+        support=(0.0, np.inf),
         formula=f"{c}e^({a}t)",
-        params={"a": a},
+        params={"c": c, "a": a},
     )
 
 
@@ -196,6 +649,8 @@ def sinusoid(amplitude=1.0, frequency=1.0, phase=0.0):
         func=lambda t, amplitude=amplitude, frequency=frequency, phase=phase: amplitude
         * np.sin(2 * np.pi * frequency * t + phase),
         name="Sinusoid",
+        kind="Sinusoidal",
+        sq_integral=_sinusoid_sq_integral,
         formula=f"{amplitude}·sin(2π{frequency}t+{phase})",
         params={
             "amplitude": amplitude,
@@ -209,6 +664,8 @@ def sinc_signal(amplitude=1.0):
     return Signal(
         func=lambda t, amplitude=amplitude: amplitude * np.sinc(t),
         name="Sinc",
+        kind="sinc",
+        sq_integral=_sinc_sq_integral,
         formula="sin(πt)/(πt)",
         params={"amplitude": amplitude},
     )
@@ -218,6 +675,8 @@ def signum_signal():
     return Signal(
         func=lambda t: np.sign(t),
         name="Signum",
+        kind="signum",
+        sq_integral=_signum_sq_integral,
         formula="sgn(t)",
     )
 
@@ -228,6 +687,10 @@ def rectangular_pulse(start=-1.0, end=1.0, amplitude=1.0):
             (t >= start) & (t <= end), amplitude, 0.0
         ),
         name="Rectangular Pulse",
+        kind="rectangular",
+        sq_integral=_rect_sq_integral,
+        structure=("box", start, end, amplitude),
+        support=(start, end),
         formula=f"{amplitude}·rect(t)",
         params={"start": start, "end": end, "amplitude": amplitude},
     )
@@ -242,11 +705,97 @@ def triangular_wave(start=0.0, end=1.0, amplitude=1.0):
     return Signal(
         func=tri,
         name="Triangular",
+        kind="triangular",
+        sq_integral=_tri_sq_integral if end != start else None,
+        support=(min(start, end), max(start, end)),
         formula=f"{amplitude}·tri(t)",
         params={"start": start, "end": end, "amplitude": amplitude},
     )
 
 
+# Digital modulation sources
+# ==============================
+def _keyed_signal(scheme, name, formula, params):
+    k = params.get("order", 2).bit_length() - 1
+    duration = -(-params["n_bits"] // k) * k / params["bit_rate"]
+    return Signal(
+        func=functools.partial(keyed_waveform, scheme=scheme),
+        name=name,
+        kind=scheme,
+        support=(0.0, duration),
+        formula=formula,
+        params=params,
+    )
+
+
+def ask_signal(n_bits=64, bit_rate=1.0, carrier=4.0, amplitude=1.0, seed=0):
+    """On-off keyed carrier; random bits drawn from `seed`"""
+    return _keyed_signal(
+        "ASK",
+        "ASK",
+        f"{amplitude}·a(t)·cos(2π{carrier}t)",
+        {
+            "n_bits": n_bits,
+            "bit_rate": bit_rate,
+            "carrier": carrier,
+            "amplitude": amplitude,
+            "seed": seed,
+        },
+    )
+
+
+def fsk_signal(
+    n_bits=64, bit_rate=1.0, carrier=4.0, order=2, spacing=1.0, amplitude=1.0, seed=0
+):
+    """M-ary FSK with tones `spacing` Hz apart around the carrier"""
+    return _keyed_signal(
+        "FSK",
+        f"{order}-FSK",
+        f"{amplitude}·cos(2π({carrier}+Δf(t))t)",
+        {
+            "n_bits": n_bits,
+            "bit_rate": bit_rate,
+            "carrier": carrier,
+            "order": order,
+            "spacing": spacing,
+            "amplitude": amplitude,
+            "seed": seed,
+        },
+    )
+
+
+def psk_signal(n_bits=64, bit_rate=1.0, carrier=4.0, order=2, amplitude=1.0, seed=0):
+    return _keyed_signal(
+        "PSK",
+        f"{order}-PSK",
+        f"{amplitude}·cos(2π{carrier}t+φ(t))",
+        {
+            "n_bits": n_bits,
+            "bit_rate": bit_rate,
+            "carrier": carrier,
+            "order": order,
+            "amplitude": amplitude,
+            "seed": seed,
+        },
+    )
+
+
+def qam_signal(n_bits=64, bit_rate=1.0, carrier=4.0, order=16, amplitude=1.0, seed=0):
+    return _keyed_signal(
+        "QAM",
+        f"{order}-QAM",
+        f"{amplitude}·[I(t)cos(2π{carrier}t)-Q(t)sin(2π{carrier}t)]",
+        {
+            "n_bits": n_bits,
+            "bit_rate": bit_rate,
+            "carrier": carrier,
+            "order": order,
+            "amplitude": amplitude,
+            "seed": seed,
+        },
+    )
+
+
 # Registry
 # ==============================
 SIGNAL_REGISTRY = {
@@ -261,6 +810,14 @@ SIGNAL_REGISTRY = {
     "triangular": triangular_wave,
 }
 
+# Keyed bit-stream sources, kept apart from the analog signal pickers
+MODULATION_REGISTRY = {
+    "ASK": ask_signal,
+    "FSK": fsk_signal,
+    "PSK": psk_signal,
+    "QAM": qam_signal,
+}
+
 
 def get_available_signals():
     """Return all registered signal names in display format (title case with spaces)"""
@@ -0,0 +1,153 @@
+import functools
+
+import numpy as np
+from scipy import fft as sp_fft
+
+DEFAULT_NPERSEG = 256
+
+# Welch segments transformed per batched rfft call; bounds the temporaries
+# to about _SEGMENTS_PER_BATCH * nperseg complex values.
+_SEGMENTS_PER_BATCH = 256
+
+
+@functools.lru_cache(maxsize=32)
+def window(name, n):
+    """Read-only periodic window of length n (as used by scipy.signal.welch)"""
+    # scipy.signal takes over a second to import; only pay for it when needed
+    from scipy.signal import get_window
+
+    w = get_window(name, n)
+    w.setflags(write=False)
+    return w
+
+
+@functools.lru_cache(maxsize=32)
+def frequency_grid(n_fft, fs):
+    """Read-only one-sided frequency grid of an n_fft-point real FFT"""
+    freqs = sp_fft.rfftfreq(n_fft, d=1.0 / fs)
+    freqs.setflags(write=False)
+    return freqs
+
+
+class Spectrum:
+    """One-sided spectrum: values[k] belongs to frequency freqs[k] (Hz)"""
+
+    def __init__(self, freqs, values, n_fft):
+        self.freqs = freqs
+        self.values = values
+        self.n_fft = n_fft
+
+    @property
+    def magnitude(self):
+        return np.abs(self.values)
+
+    def phase(self, threshold=1e-6):
+        """
+        Phase in radians; NaN where the magnitude is below threshold times
+        its peak, since the phase of numerical noise is meaningless.
+        """
+        magnitude = self.magnitude
+        phase = np.angle(self.values)
+        if magnitude.size:
+            phase[magnitude < threshold * magnitude.max()] = np.nan
+        return phase
+
+    def occupied_bandwidth(self, fraction=0.99):
+        """Lowest frequency below which `fraction` of the total power lies"""
+        power = np.cumsum(self.magnitude**2)
+        if power.size == 0 or power[-1] == 0:
+            return 0.0
+        index = np.searchsorted(power, fraction * power[-1])
+        return float(self.freqs[min(index, self.freqs.size - 1)])
+
+
+def spectrum(x, fs, t0=0.0):
+    """
+    Fourier transform of a sampled real signal, for f >= 0.
+
+    X(f) ≈ dt · Σ x[n] e^{-j2πf t_n} with t_n = t0 + n·dt, so magnitudes
+    approximate the continuous-time transform and phases refer to t = 0.
+    The FFT is zero-padded to the next fast length.
+
+    Parameters:
+        x : array-like
+            Real samples (1-D)
+        fs : float
+            Sampling frequency (Hz)
+        t0 : float
+            Time of the first sample
+
+    Returns:
+        Spectrum
+    """
+    x = np.asarray(x, dtype=float)
+    n_fft = sp_fft.next_fast_len(max(x.size, 1), real=True)
+    freqs = frequency_grid(n_fft, fs)
+
+    values = sp_fft.rfft(x, n_fft)
+    values /= fs
+    if t0 != 0.0:
+        values *= np.exp(-2j * np.pi * t0 * freqs)
+
+    return Spectrum(freqs, values, n_fft)
+
+
+class StreamingWelch:
+    """
+    Welch power spectral density computed chunk by chunk.
+
+    Matches scipy.signal.welch(x, fs, window, nperseg, noverlap) with its
+    defaults (constant detrend, one-sided density scaling, mean average),
+    but only keeps the last nperseg samples and the running sum of the
+    periodograms between update() calls.
+    """
+
+    def __init__(self, fs, nperseg=DEFAULT_NPERSEG, noverlap=None, window_name="hann"):
+        if noverlap is None:
+            noverlap = nperseg // 2
+        if not 0 <= noverlap < nperseg:
+            raise ValueError("noverlap must satisfy 0 <= noverlap < nperseg")
+
+        self.fs = fs
+        self.nperseg = nperseg
+        self.hop = nperseg - noverlap
+        self.window = window(window_name, nperseg)
+        self.n_segments = 0
+
+        self._tail = np.empty(0)
+        self._periodogram_sum = np.zeros(nperseg // 2 + 1)
+
+    def update(self, x):
+        buffer = np.concatenate((self._tail, np.asarray(x, dtype=float)))
+        if buffer.size < self.nperseg:
+            self._tail = buffer
+            return
+
+        segments = np.lib.stride_tricks.sliding_window_view(buffer, self.nperseg)
+        segments = segments[:: self.hop]
+
+        for first in range(0, len(segments), _SEGMENTS_PER_BATCH):
+            batch = segments[first : first + _SEGMENTS_PER_BATCH]
+            batch = batch - batch.mean(axis=1, keepdims=True)
+            batch *= self.window
+            spec = sp_fft.rfft(batch, axis=1)
+            self._periodogram_sum += (spec.real**2 + spec.imag**2).sum(axis=0)
+
+        self.n_segments += len(segments)
+        self._tail = buffer[len(segments) * self.hop :].copy()
+
+    def result(self):
+        """PSD as a Spectrum (units²/Hz)"""
+        if self.n_segments == 0:
+            raise ValueError("not enough samples for a single Welch segment")
+
+        psd = self._periodogram_sum / (
+            self.n_segments * self.fs * np.sum(self.window**2)
+        )
+        # One-sided: fold negative frequencies onto positive ones
+        if self.nperseg % 2:
+            psd[1:] *= 2
+        else:
+            psd[1:-1] *= 2
+
+        return Spectrum(frequency_grid(self.nperseg, self.fs), psd, self.nperseg)
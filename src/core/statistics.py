@@ -0,0 +1,174 @@
+import numpy as np
+
+# Samples evaluated per chunk when streaming over a TimeAxis
+DEFAULT_CHUNK_SIZE = 1 << 18
+
+# Running sums restart their cumulative sum every this many samples, so
+# the prefix sums never grow large enough to cancel away small windows.
+DEFAULT_ANCHOR_BLOCK = 1 << 16
+
+
+class CompensatedSum:
+    """Running sum with Neumaier (improved Kahan) error compensation"""
+
+    def __init__(self):
+        self.total = 0.0
+        self._compensation = 0.0
+
+    def add(self, value):
+        value = float(value)
+        total = self.total + value
+        if abs(self.total) >= abs(value):
+            self._compensation += (self.total - total) + value
+        else:
+            self._compensation += (value - total) + self.total
+        self.total = total
+
+    @property
+    def value(self):
+        return self.total + self._compensation
+
+
+class SignalMetrics:
+    """Energy, power, peak and RMS of a signal over a uniformly sampled window"""
+
+    def __init__(self, energy, power, peak, rms, n, duration):
+        self.energy = energy
+        self.power = power
+        self.peak = peak
+        self.rms = rms
+        self.n = n
+        self.duration = duration
+
+    def __repr__(self):
+        return (
+            f"SignalMetrics(energy={self.energy!r}, power={self.power!r}, "
+            f"peak={self.peak!r}, rms={self.rms!r}, n={self.n})"
+        )
+
+
+class StreamingMetrics:
+    """
+    Single-pass reducer for |x|² statistics over consecutive chunks.
+
+    Each chunk is reduced with NumPy's pairwise summation and the chunk
+    totals are combined with compensated summation, so accuracy does not
+    degrade with the number of chunks and memory stays O(chunk).
+    """
+
+    def __init__(self, dt):
+        self.dt = dt
+        self._sum_sq = CompensatedSum()
+        self.n = 0
+        self.peak = 0.0
+        self._first_sq = None
+        self._last_sq = None
+
+    def update(self, x):
+        x = np.asarray(x)
+        if x.size == 0:
+            return
+
+        sq = np.abs(x) ** 2 if np.iscomplexobj(x) else np.square(x)
+        self._sum_sq.add(np.sum(sq))
+        self.peak = max(self.peak, float(np.max(np.abs(x))))
+
+        if self._first_sq is None:
+            self._first_sq = float(sq[0])
+        self._last_sq = float(sq[-1])
+        self.n += x.size
+
+    def result(self):
+        if self.n < 2:
+            return SignalMetrics(0.0, 0.0, self.peak, 0.0, self.n, 0.0)
+
+        # Trapezoidal rule on a uniform grid: dt * (Σ x² - (x₀² + x_N²) / 2)
+        energy = self.dt * (self._sum_sq.value - 0.5 * (self._first_sq + self._last_sq))
+        duration = self.dt * (self.n - 1)
+        power = energy / duration if duration else 0.0
+
+        return SignalMetrics(
+            energy=energy,
+            power=power,
+            peak=self.peak,
+            rms=float(np.sqrt(max(power, 0.0))),
+            n=self.n,
+            duration=duration,
+        )
+
+
+def stream_metrics(signal, axis, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Energy, power, peak and RMS of `signal` over a TimeAxis in one pass.
+
+    The axis is evaluated chunk by chunk and never materialized, so memory
+    use is bounded by chunk_size regardless of the number of samples.
+    """
+    reducer = StreamingMetrics(axis.step)
+    for chunk in axis.iter_chunks(chunk_size):
+        reducer.update(signal.evaluate(chunk.generate()))
+    return reducer.result()
+
+
+def running_mean(a, windows, block_size=DEFAULT_ANCHOR_BLOCK):
+    """
+    Centered moving averages of `a` for several window lengths in O(N) each.
+
+    Matches np.convolve(a, np.ones(w) / w, mode="same") (zeros outside `a`),
+    but uses differences of cumulative sums. The cumulative sum is
+    re-anchored at every block of block_size samples, which bounds its
+    magnitude and therefore the cancellation error of each difference.
+
+    Parameters:
+        a : array-like
+            Samples (1-D)
+        windows : int or iterable of int
+            Window lengths in samples (clipped to [1, len(a)])
+        block_size : int
+            Re-anchoring interval
+
+    Returns:
+        dict mapping each requested window length to its running mean
+    """
+    a = np.asarray(a, dtype=float)
+    n = a.size
+    if isinstance(windows, (int, np.integer)):
+        windows = (windows,)
+    windows = [int(w) for w in windows]
+
+    results = {w: np.empty(n) for w in windows}
+    if n == 0:
+        return results
+
+    spans = {w: min(max(w, 1), n) for w in windows}
+    reach_left = max(s - 1 - (s - 1) // 2 for s in spans.values())
+    reach_right = max((s - 1) // 2 for s in spans.values())
+    block_size = max(block_size, 2 * max(spans.values()))
+
+    prefix = np.empty(min(block_size + reach_left + reach_right, n) + 1)
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        lo = max(start - reach_left, 0)
+        hi = min(stop + reach_right, n)
+
+        prefix[0] = 0.0
+        np.cumsum(a[lo:hi], out=prefix[1 : hi - lo + 1])
+
+        i = np.arange(start, stop)
+        for w in windows:
+            span = spans[w]
+            right = np.minimum(i + (span - 1) // 2 + 1, n)  # exclusive
+            # Windows are clipped at the edges but always divided by the
+            # full span, like zero padding in np.convolve
+            left = np.maximum(i + (span - 1) // 2 + 1 - span, 0)
+            window_sum = prefix[right - lo] - prefix[left - lo]
+            results[w][start:stop] = window_sum / span
+
+    return results
+
+
+def running_power(x, windows, block_size=DEFAULT_ANCHOR_BLOCK):
+    """Running mean of |x|² for each window length (see running_mean)"""
+    x = np.asarray(x)
+    sq = np.abs(x) ** 2 if np.iscomplexobj(x) else np.square(x)
+    return running_mean(sq, windows, block_size)
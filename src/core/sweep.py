@@ -0,0 +1,113 @@
+import numpy as np
+
+from src.core.signals import SIGNAL_REGISTRY, Signal
+
+# Budget for the temporaries of one block of rows (bytes)
+DEFAULT_SWEEP_BYTES = 64 * 1024 * 1024
+
+# Rough number of N-sized float64 temporaries a factory function allocates
+_TEMPORARIES_PER_ROW = 4
+
+
+def _template(source):
+    """Signal whose func/params/transform the sweep is based on"""
+    if isinstance(source, Signal):
+        template = source
+    elif isinstance(source, str):
+        template = SIGNAL_REGISTRY[source]()
+    else:
+        template = source()
+
+    if template.op is not None:
+        raise ValueError(
+            "parameter sweeps need a factory signal, not an algebra result"
+        )
+    return template
+
+
+def _broadcast_params(template, param_arrays):
+    unknown = set(param_arrays) - set(template.params)
+    if unknown:
+        raise ValueError(
+            f"{template.name} has no parameter(s) {sorted(unknown)}; "
+            f"available: {sorted(template.params)}"
+        )
+
+    arrays = {
+        name: np.asarray(value, dtype=float) for name, value in param_arrays.items()
+    }
+    lengths = {a.size for a in arrays.values() if a.ndim > 0}
+    if len(lengths) > 1:
+        raise ValueError(
+            f"parameter arrays must have equal length, got {sorted(lengths)}"
+        )
+
+    n_rows = lengths.pop() if lengths else 1
+    columns = dict(template.params)
+    for name, value in arrays.items():
+        # Column vectors broadcast against the (1, N) time row
+        columns[name] = value.reshape(-1, 1) if value.ndim > 0 else value
+    return columns, n_rows
+
+
+def iter_sweep(source, t, memory_budget=DEFAULT_SWEEP_BYTES, **param_arrays):
+    """
+    Evaluate a signal family block by block along the parameter axis.
+
+    Parameters:
+        source : str, factory or Signal
+            SIGNAL_REGISTRY key, factory function, or a factory-built Signal
+            (its other parameters and time transforms are kept)
+        t : array-like
+            Time samples (1-D)
+        memory_budget : int
+            Approximate bytes of temporaries per block
+        **param_arrays :
+            Parameter name -> 1-D array of values (equal lengths) or scalar
+
+    Yields:
+        rows : slice
+            Rows of the full (n_params, n_samples) result in this block
+        block : ndarray
+            Samples for those parameter sets, shape (rows, n_samples)
+    """
+    template = _template(source)
+    columns, n_rows = _broadcast_params(template, param_arrays)
+
+    alpha, beta = template.affine
+    t_row = (alpha * np.asarray(t, dtype=float) + beta).reshape(1, -1)
+    n_samples = t_row.shape[1]
+
+    row_bytes = max(n_samples, 1) * 8 * _TEMPORARIES_PER_ROW
+    rows_per_block = max(1, int(memory_budget // row_bytes))
+
+    for start in range(0, n_rows, rows_per_block):
+        stop = min(start + rows_per_block, n_rows)
+        params = {
+            name: value[start:stop] if np.ndim(value) == 2 else value
+            for name, value in columns.items()
+        }
+        block = template.func(t_row, **params)
+        yield slice(start, stop), np.broadcast_to(block, (stop - start, n_samples))
+
+
+def sweep(source, t, memory_budget=DEFAULT_SWEEP_BYTES, **param_arrays):
+    """
+    Evaluate a signal for many parameter sets at once with broadcasting.
+
+    Example:
+        sweep("Sinusoidal", t, frequency=np.arange(1, 11))  # 10 harmonics
+
+    Returns:
+        ndarray of shape (n_params, n_samples); see iter_sweep for arguments.
+    """
+    out = None
+    for rows, block in iter_sweep(source, t, memory_budget, **param_arrays):
+        if out is None:
+            n_rows = max(
+                (np.size(v) for v in param_arrays.values() if np.ndim(v) > 0),
+                default=1,
+            )
+            out = np.empty((n_rows, block.shape[1]), dtype=block.dtype)
+        out[rows] = block
+    return out
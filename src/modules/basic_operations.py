@@ -1,10 +1,11 @@
-import copy
-
 import streamlit as st
 
+from src.core.cache import signal_cache
 from src.core.signals import get_available_signals, get_signal_modes
 from src.ui.build_signals import build_signal_ui
+from src.ui.notices import show_clamp_notice
 from src.ui.plots import plot_signal
+from src.utils.profiler import profile_stage
 from src.utils.time_axis import TimeAxis
 
 
@@ -46,7 +47,9 @@ def run_basic_operations_module():
     # Time Axis Generation
     # --------------------------------
     time = TimeAxis(t_min=t_min, t_max=t_max, dt=1 / fs, signal_mode=signal_mode)
-    t = time.generate()
+    t = signal_cache.time_axis(time)
+
+    show_clamp_notice(time)
 
     # Signal Construction
     # --------------------------------
@@ -65,7 +68,7 @@ def run_basic_operations_module():
 
     # Apply Transformations
     # ------------------------------
-    transformed_signal = copy.deepcopy(signal)
+    transformed_signal = signal
 
     if shift_time != 0.0:
         transformed_signal = transformed_signal.time_shift(shift_time)
@@ -79,8 +82,8 @@ def run_basic_operations_module():
     # Output
     # --------------------------------
     st.markdown("-----")
-    y_original = signal.evaluate(t)
-    y_transformed = transformed_signal.evaluate(t)
+    y_original = signal_cache.evaluate(signal, time)
+    y_transformed = signal_cache.evaluate(transformed_signal, time)
     col_left, _, col_right = st.columns([1, 0.1, 1])
 
     # Left column: Input Signal
@@ -95,7 +98,8 @@ def run_basic_operations_module():
             discrete=True if signal_mode == "Discrete" else False,
             autoscale=True,
         )
-        st.plotly_chart(fig, use_container_width=True, key="input_signal")
+        with profile_stage("plotly_chart"):
+            st.plotly_chart(fig, use_container_width=True, key="input_signal")
 
     # Right column: Output Plot
     # ------------------------
@@ -109,4 +113,5 @@ def run_basic_operations_module():
             discrete=True if signal_mode == "Discrete" else False,
             autoscale=True,
         )
-        st.plotly_chart(fig, use_container_width=True, key="transformed_signal")
+        with profile_stage("plotly_chart"):
+            st.plotly_chart(fig, use_container_width=True, key="transformed_signal")
@@ -0,0 +1,111 @@
+import functools
+
+import numpy as np
+import streamlit as st
+
+# Project Imports
+from src.core.ber import DEFAULT_BER_FLOOR, ber_curve, theoretical_ber
+from src.core.modulation import get_modulations
+from src.ui.plots import plot_signal
+from src.utils.profiler import profile_stage
+
+
+@functools.lru_cache(maxsize=32)
+def _simulate(modulation, ebn0_db_values, relative_width, max_bits):
+    # Same inputs, same seed: reruns that only change the view are free
+    return tuple(
+        ber_curve(
+            modulation,
+            ebn0_db_values,
+            seed=0,
+            relative_width=relative_width,
+            max_bits=max_bits,
+        )
+    )
+
+
+def run_ber_module():
+    st.markdown("## BER vs SNR")
+    st.markdown(
+        "Random bits are mapped to symbols, sent through an additive white "
+        "Gaussian noise (AWGN) channel and detected again. The bit error "
+        "rate (BER) is the fraction of bits that come out wrong."
+    )
+
+    col0, col1, col2, col3 = st.columns(4)
+
+    with col0:
+        modulation = st.selectbox("Modulation", get_modulations(), key="ber_mod")
+    with col1:
+        ebn0_min, ebn0_max = st.slider(
+            "Eb/N0 range (dB)", -4, 16, (0, 10), key="ber_ebn0_range"
+        )
+    with col2:
+        step = st.select_slider(
+            "Eb/N0 step (dB)", options=[0.5, 1.0, 2.0], value=1.0, key="ber_step"
+        )
+    with col3:
+        max_bits = st.select_slider(
+            "Max bits per point",
+            options=[10**5, 10**6, 10**7],
+            value=10**6,
+            format_func=lambda n: f"{n:.0e}",
+            key="ber_max_bits",
+        )
+
+    relative_width = st.slider(
+        "Target confidence interval width (relative to BER)",
+        0.05,
+        1.0,
+        0.2,
+        0.05,
+        help="Each point stops once its 95% interval is this tight",
+        key="ber_precision",
+    )
+
+    ebn0_db = tuple(float(v) for v in np.arange(ebn0_min, ebn0_max + step / 2, step))
+
+    with profile_stage("ber_curve"):
+        points = _simulate(modulation, ebn0_db, relative_width, max_bits)
+
+    st.markdown("-----")
+
+    ber = np.array([point.ber for point in points])
+    fig = plot_signal(
+        np.array(ebn0_db),
+        ber,
+        title=f"{modulation} over AWGN",
+        log_y=True,
+        xaxis_title="Eb/N0 (dB)",
+        yaxis_title="Bit Error Rate",
+    )
+    with profile_stage("plotly_chart"):
+        st.plotly_chart(fig, use_container_width=True, key="ber_plot")
+
+    theory = theoretical_ber(modulation, ebn0_db)
+    rows = []
+    for point, expected in zip(points, theory):
+        low, high = point.interval
+        rows.append(
+            {
+                "Eb/N0 (dB)": point.ebn0_db,
+                "BER": point.ber,
+                "95% CI": f"[{low:.2e}, {high:.2e}]",
+                "Theory": expected,
+                "Bits": point.bits,
+                "Errors": point.errors,
+                "Converged": point.converged,
+            }
+        )
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+
+    if any(point.below_floor for point in points):
+        st.caption(
+            f"Points whose 95% interval lies entirely below {DEFAULT_BER_FLOOR:.0e} "
+            "stop early; their BER is only bounded, not estimated."
+        )
+    if not all(point.converged for point in points):
+        st.caption(
+            "Points that did not converge hit the bit limit; their intervals "
+            "are wider than requested (raise Max bits per point)."
+        )
@@ -1,8 +1,11 @@
-import numpy as np
 import streamlit as st
 
+from src.core.cache import signal_cache
+from src.core.convolution import convolve_sampled
 from src.ui.build_signals import build_signal_ui
+from src.ui.notices import show_clamp_notice
 from src.ui.plots import plot_signal
+from src.utils.profiler import profile_stage
 from src.utils.time_axis import TimeAxis
 from src.core.signals import get_available_signals, get_signal_modes
 
@@ -49,7 +52,9 @@ def run_convolution_module():
 
     # Generate time axis
     time = TimeAxis(t_min=t_min, t_max=t_max, dt=1.0 / fs, signal_mode=signal_mode)
-    t = time.generate()
+    t = signal_cache.time_axis(time)
+
+    show_clamp_notice(time)
 
     # Two input signals side-by-side
     left_col, right_col = st.columns(2)
@@ -105,25 +110,25 @@ def run_convolution_module():
             sig2 = sig2 * amp2
 
     # Evaluate signals
-    x = sig1.evaluate(t)
-    h = sig2.evaluate(t)
+    x = signal_cache.evaluate(sig1, time)
+    h = signal_cache.evaluate(sig2, time)
 
     # Plot inputs
     col_a, col_b = st.columns(2)
     with col_a:
         st.markdown(f"**Signal 1:** {sig1.formula}")
-        st.plotly_chart(
-            plot_signal(t, x, title=sig1.formula, discrete=(signal_mode == "Discrete")),
-            use_container_width=True,
-            key="conv_sig1_plot",
+        fig = plot_signal(
+            t, x, title=sig1.formula, discrete=(signal_mode == "Discrete")
         )
+        with profile_stage("plotly_chart"):
+            st.plotly_chart(fig, use_container_width=True, key="conv_sig1_plot")
     with col_b:
         st.markdown(f"**Signal 2:** {sig2.formula}")
-        st.plotly_chart(
-            plot_signal(t, h, title=sig2.formula, discrete=(signal_mode == "Discrete")),
-            use_container_width=True,
-            key="conv_sig2_plot",
+        fig = plot_signal(
+            t, h, title=sig2.formula, discrete=(signal_mode == "Discrete")
         )
+        with profile_stage("plotly_chart"):
+            st.plotly_chart(fig, use_container_width=True, key="conv_sig2_plot")
 
     st.markdown("----")
 
@@ -132,27 +137,29 @@ def run_convolution_module():
         "Convolution Mode", ["full", "same", "valid"], index=0, key="conv_mode_select"
     )
 
-    # Compute convolution (use full then slice t accordingly to keep time alignment correct)
-    dt = t[1] - t[0] if len(t) > 1 else 1.0
-    y_full = np.convolve(x, h, mode="full") * dt
-    full_len = y_full.size
-    t_full = np.linspace(2 * t[0], 2 * t[-1], full_len)
-
-    if conv_mode == "full":
-        y = y_full
-        t_out = t_full
-    else:
-        y = np.convolve(x, h, mode=conv_mode) * dt
-        n_y = len(y)
-        start = (full_len - n_y) // 2
-        t_out = t_full[start : start + n_y]
+    # Compute convolution ("full" is computed once, other modes are sliced from it)
+    t_out, y, result = convolve_sampled(
+        t,
+        x,
+        h,
+        mode=conv_mode,
+        x_structure=sig1.structure,
+        h_structure=sig2.structure,
+        x_support=sig1.support,
+        h_support=sig2.support,
+    )
 
     # Output plot
     st.markdown("### Output Signal (Convolution Result)")
-    st.plotly_chart(
-        plot_signal(
-            t_out, y, title=f"y(t) = {sig1.formula} * {sig2.formula}", discrete=False
-        ),
-        use_container_width=True,
-        key="conv_output_plot",
+    fig = plot_signal(
+        t_out, y, title=f"y(t) = {sig1.formula} * {sig2.formula}", discrete=False
+    )
+    with profile_stage("plotly_chart"):
+        st.plotly_chart(fig, use_container_width=True, key="conv_output_plot")
+    caption = (
+        f"Computed with the {result.method} method in {result.elapsed * 1e3:.2f} ms"
     )
+    if result.active_lengths is not None:
+        n_x, n_h = result.active_lengths
+        caption += f" on the active {n_x:,} × {n_h:,} of {len(t):,} samples"
+    st.caption(caption)
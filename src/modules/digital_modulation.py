@@ -0,0 +1,148 @@
+import numpy as np
+import streamlit as st
+
+# Project Imports
+from src.core.cache import signal_cache
+from src.core.modulation import KEYING_SCHEMES, keying_table, random_bits
+from src.core.signals import MODULATION_REGISTRY
+from src.ui.plots import plot_signal
+from src.utils.profiler import profile_stage
+from src.utils.time_axis import TimeAxis
+
+# The time axis and the waveform are each cached as float64; keeping both
+# under half the cache budget leaves room for the rest of the session
+_CACHE_SHARE = 4
+
+
+def _symbol_rows(scheme, order, carrier, spacing):
+    """One table row per symbol label: its bits and what it does to the carrier"""
+    magnitude, phase, frequency = keying_table(scheme, order, carrier, spacing)
+    k = order.bit_length() - 1
+    return [
+        {
+            "Bits": format(label, f"0{k}b"),
+            "Amplitude": magnitude[label],
+            "Phase (°)": np.degrees(phase[label]),
+            "Frequency (Hz)": frequency[label],
+        }
+        for label in range(order)
+    ]
+
+
+def run_digital_modulation_module():
+    st.markdown("## Digital Modulation")
+    st.markdown(
+        "Bits are grouped into symbols of log₂(M) bits and every symbol keys "
+        "the carrier: its amplitude (ASK), frequency (FSK), phase (PSK) or "
+        "amplitude and phase together (QAM)."
+    )
+
+    # Bit stream and scheme
+    # -------------------------------------------------
+    col0, col1, col2, col3 = st.columns(4)
+
+    with col0:
+        scheme = st.selectbox("Scheme", tuple(MODULATION_REGISTRY), key="dm_scheme")
+    with col1:
+        order = st.selectbox(
+            "Order (M)", tuple(KEYING_SCHEMES[scheme]), key=f"dm_order_{scheme}"
+        )
+    with col2:
+        n_bits = st.select_slider(
+            "Bits",
+            options=[16, 64, 256, 1024, 10**4, 10**5, 10**6],
+            value=64,
+            format_func=lambda n: f"{n:,}",
+            key="dm_bits",
+        )
+    with col3:
+        seed = st.number_input("Random Seed", min_value=0, value=0, key="dm_seed")
+
+    col_a, col_b, col_c, col_d = st.columns(4)
+
+    with col_a:
+        bit_rate = st.number_input(
+            "Bit Rate (bit/s)",
+            min_value=1.0,
+            max_value=10000.0,
+            value=10.0,
+            key="dm_bit_rate",
+        )
+    with col_b:
+        carrier = st.number_input(
+            "Carrier Frequency (Hz)",
+            min_value=0.0,
+            value=20.0,
+            key="dm_carrier",
+        )
+    with col_c:
+        samples_per_bit = st.select_slider(
+            "Samples per Bit", options=[4, 8, 16, 32, 64], value=8, key="dm_spb"
+        )
+    with col_d:
+        spacing = st.number_input(
+            "Tone Spacing (Hz)",
+            min_value=0.0,
+            value=10.0,
+            disabled=scheme != "FSK",
+            key="dm_spacing",
+        )
+
+    # Waveform
+    # -------------------------------------------------
+    options = {"n_bits": n_bits, "bit_rate": bit_rate, "carrier": carrier}
+    if scheme != "ASK":
+        options["order"] = order
+    if scheme == "FSK":
+        options["spacing"] = spacing
+    signal = MODULATION_REGISTRY[scheme](seed=int(seed), **options)
+
+    fs = bit_rate * samples_per_bit
+    n_samples = int(round(signal.support[1] * fs))
+    max_samples = signal_cache.max_bytes // (_CACHE_SHARE * 8)
+    if n_samples > max_samples:
+        st.warning(
+            f"{n_bits:,} bits at {samples_per_bit} samples per bit need "
+            f"{n_samples:,} samples; the limit is {max_samples:,}. "
+            "Lower the number of bits or the samples per bit."
+        )
+        return
+    time = TimeAxis.from_samples(0.0, 1 / fs, n_samples)
+
+    highest = carrier + (order - 1) / 2 * spacing if scheme == "FSK" else carrier
+    if highest >= fs / 2:
+        st.warning(
+            f"The carrier ({highest:g} Hz) is above half the sampling rate "
+            f"({fs / 2:g} Hz) and aliases; raise the samples per bit."
+        )
+
+    with profile_stage("modulate"):
+        t = signal_cache.time_axis(time)
+        x = signal_cache.evaluate(signal, time)
+        # Bits as a non-return-to-zero level held for each bit period
+        nrz = np.repeat(random_bits(n_bits, int(seed)), samples_per_bit)
+
+    st.markdown("-----")
+
+    fig = plot_signal(t[: nrz.size], nrz, title="Bit Stream", yaxis_title="Bit")
+    with profile_stage("plotly_chart"):
+        st.plotly_chart(fig, use_container_width=True, key="dm_bits_plot")
+
+    fig = plot_signal(t, x, title=f"{signal.name}: {signal.formula}")
+    with profile_stage("plotly_chart"):
+        st.plotly_chart(fig, use_container_width=True, key="dm_wave_plot")
+
+    n_symbols = -(-n_bits // (order.bit_length() - 1))
+    st.caption(
+        f"{n_bits:,} bits → {n_symbols:,} symbols, "
+        f"{len(time):,} samples at {fs:g} Hz"
+    )
+
+    # Symbol mapping
+    # -------------------------------------------------
+    st.markdown("#### Symbol Mapping")
+    st.dataframe(
+        _symbol_rows(scheme, order, carrier, options.get("spacing", 1.0)),
+        use_container_width=True,
+        hide_index=True,
+    )
@@ -1,10 +1,12 @@
-import numpy as np
 import streamlit as st
 
 # Project Imports
+from src.core.cache import signal_cache
 from src.core.signals import get_available_signals
+from src.core.statistics import running_power
 from src.ui.build_signals import build_signal_ui
 from src.ui.plots import plot_signal
+from src.utils.profiler import profile_stage
 from src.utils.time_axis import TimeAxis
 
 
@@ -44,16 +46,17 @@ def run_energy_power_module():
     # Time Axis
     # -------------------------------------------------
     time = TimeAxis(t_min=t_min, t_max=t_max, dt=1 / fs)
-    t = time.generate()
+    t = signal_cache.time_axis(time)
 
     # Signal Construction
     # -------------------------------------------------
     signal = build_signal_ui(signal_type)
-    x = signal.evaluate(t)
+    x = signal_cache.evaluate(signal, time)
 
     # Energy & Power Computation
     # -------------------------------------------------
-    signal_type, E, P = signal.classify_signal(t)
+    with profile_stage("classify_signal"):
+        signal_type, E, P = signal.classify_signal(time)
 
     # Display Section
     # -------------------------------------------------
@@ -67,6 +70,11 @@ def run_energy_power_module():
     with col_3:
         st.info(signal_type)
 
+    if signal.analytic_energy(time.start, time.stop) is not None:
+        st.caption("E and P are exact (closed-form integral over the time window).")
+    else:
+        st.caption("E and P are trapezoidal approximations from the samples.")
+
     col_left, _, col_right = st.columns([1, 0.1, 1])
 
     with col_left:
@@ -78,14 +86,22 @@ def run_energy_power_module():
             discrete=False,
             autoscale=True,
         )
-        st.plotly_chart(fig1, width="stretch", key="energy_power_signal")
+        with profile_stage("plotly_chart"):
+            st.plotly_chart(fig1, width="stretch", key="energy_power_signal")
 
     with col_right:
         # Sliding window power (for visualization)
-        window_size = max(10, int(0.05 * len(x)))  # 5% window
-        power_time = np.convolve(
-            np.abs(x) ** 2, np.ones(window_size) / window_size, mode="same"
+        window_percent = st.slider(
+            "Power Window (% of duration)",
+            1,
+            25,
+            5,
+            1,
+            key="energy_power_window",
         )
+        window_size = max(10, int(window_percent / 100 * len(x)))
+        with profile_stage("running_power"):
+            power_time = running_power(x, window_size)[window_size]
 
         # Power over time
         fig2 = plot_signal(
@@ -95,7 +111,8 @@ def run_energy_power_module():
             discrete=False,
             autoscale=True,
         )
-        st.plotly_chart(fig2, width="stretch", key="energy_power_plot")
+        with profile_stage("plotly_chart"):
+            st.plotly_chart(fig2, width="stretch", key="energy_power_plot")
 
     # Educational Notes
     # -------------------------------------------------
@@ -0,0 +1,159 @@
+import streamlit as st
+
+# Project Imports
+from src.core.cache import signal_cache
+from src.core.filters import FILTER_TYPES, FilteredSignal
+from src.core.signals import get_available_signals, sinusoid
+from src.core.spectral import spectrum
+from src.ui.build_signals import build_signal_ui
+from src.ui.plots import plot_signal
+from src.utils.profiler import profile_stage
+from src.utils.time_axis import TimeAxis
+
+
+def run_filtering_module():
+    st.markdown("## Filtering")
+    st.markdown(
+        "A filter keeps some frequencies and attenuates others. Add a "
+        "high-frequency interference tone and move the cutoff to see it removed."
+    )
+
+    # Signal and time axis
+    # -------------------------------------------------
+    col0, col1, col2, col3 = st.columns(4)
+
+    with col0:
+        signal_type = st.selectbox(
+            "Select Signal",
+            get_available_signals(),
+            index=get_available_signals().index("Sinusoidal"),
+            key="filter_signal_type",
+        )
+    with col1:
+        t_max = st.number_input(
+            "Duration (s)", min_value=0.1, value=2.0, step=0.5, key="filter_duration"
+        )
+    with col2:
+        fs = st.number_input(
+            "Sampling Frequency (Hz)",
+            min_value=100,
+            max_value=50000,
+            value=1000,
+            step=100,
+            key="filter_fs",
+        )
+    with col3:
+        interference = st.number_input(
+            "Interference Tone (Hz, 0 = off)",
+            min_value=0.0,
+            max_value=fs / 2,
+            value=min(50.0, fs / 2),
+            step=5.0,
+            key="filter_interference",
+        )
+
+    time = TimeAxis(t_min=0.0, t_max=t_max, dt=1 / fs)
+    t = signal_cache.time_axis(time)
+
+    signal = build_signal_ui(signal_type, key_prefix="filter")
+    if interference > 0:
+        signal = signal + sinusoid(amplitude=0.5, frequency=interference)
+
+    # Filter
+    # -------------------------------------------------
+    st.markdown("-----")
+    col_a, col_b, col_c, col_d = st.columns(4)
+    nyquist = fs / 2
+
+    with col_a:
+        kind = st.selectbox("Filter Type", FILTER_TYPES, key="filter_kind")
+    with col_b:
+        method = st.radio(
+            "Design", ("iir", "fir"), horizontal=True, key="filter_method"
+        )
+    with col_c:
+        order = st.slider(
+            "Order",
+            1 if method == "iir" else 8,
+            10 if method == "iir" else 400,
+            4 if method == "iir" else 100,
+            key=f"filter_order_{method}",
+        )
+    with col_d:
+        if kind == "bandpass":
+            cutoff = st.slider(
+                "Pass Band (Hz)",
+                0.1,
+                nyquist * 0.99,
+                (min(2.0, nyquist * 0.4), min(10.0, nyquist * 0.8)),
+                key="filter_band",
+            )
+        else:
+            cutoff = st.slider(
+                "Cutoff Frequency (Hz)",
+                0.1,
+                nyquist * 0.99,
+                min(20.0, nyquist * 0.5),
+                key="filter_cutoff",
+            )
+
+    if kind == "bandpass" and cutoff[0] >= cutoff[1]:
+        st.warning("The pass band must have a positive width.")
+        return
+
+    filtered = FilteredSignal(signal, kind, cutoff, order=order, method=method)
+
+    with profile_stage("filter"):
+        x = signal_cache.evaluate(signal, time)
+        y = signal_cache.evaluate(filtered, time)
+
+    with profile_stage("spectrum"):
+        spec_before = spectrum(x, fs, t0=time.start)
+        spec_after = spectrum(y, fs, t0=time.start)
+
+    # Before / after
+    # -------------------------------------------------
+    col_left, _, col_right = st.columns([1, 0.1, 1])
+    band_edge = cutoff[1] if kind == "bandpass" else cutoff
+    f_max = min(nyquist, 2 * max(interference, band_edge))
+
+    with col_left:
+        st.text("Input")
+        fig = plot_signal(t, x, title=signal.formula)
+        with profile_stage("plotly_chart"):
+            st.plotly_chart(fig, use_container_width=True, key="filter_input_time")
+
+        fig = plot_signal(
+            spec_before.freqs,
+            spec_before.magnitude,
+            title="Input Spectrum |X(f)|",
+            xlim=(0.0, f_max),
+            autoscale=False,
+            xaxis_title="Frequency (Hz)",
+            yaxis_title="|X(f)|",
+        )
+        with profile_stage("plotly_chart"):
+            st.plotly_chart(fig, use_container_width=True, key="filter_input_spec")
+
+    with col_right:
+        st.text("Filtered Output")
+        fig = plot_signal(t, y, title=filtered.formula)
+        with profile_stage("plotly_chart"):
+            st.plotly_chart(fig, use_container_width=True, key="filter_output_time")
+
+        fig = plot_signal(
+            spec_after.freqs,
+            spec_after.magnitude,
+            title="Output Spectrum |Y(f)|",
+            xlim=(0.0, f_max),
+            autoscale=False,
+            xaxis_title="Frequency (Hz)",
+            yaxis_title="|Y(f)|",
+        )
+        with profile_stage("plotly_chart"):
+            st.plotly_chart(fig, use_container_width=True, key="filter_output_spec")
+
+    st.caption(
+        "The filter starts from rest at t = 0, so the first samples show its "
+        "transient response."
+    )
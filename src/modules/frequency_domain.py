@@ -0,0 +1,177 @@
+import streamlit as st
+
+# Project Imports
+from src.core.cache import signal_cache
+from src.core.signals import get_available_signals
+from src.core.spectral import spectrum
+from src.ui.build_signals import build_signal_ui
+from src.ui.plots import plot_signal
+from src.utils.profiler import profile_stage
+from src.utils.time_axis import TimeAxis
+
+
+def _signal_inputs(key_prefix):
+    """Signal type, time window and sampling rate widgets shared by the pages"""
+    col0, col1, col2, col3 = st.columns(4)
+
+    with col0:
+        signal_type = st.selectbox(
+            "Select Signal",
+            get_available_signals(),
+            index=get_available_signals().index("Sinusoidal"),
+            key=f"{key_prefix}_type",
+        )
+
+    with col1:
+        t_min = st.number_input(
+            "Start Time", value=-5.0, step=0.1, format="%.5f", key=f"{key_prefix}_t0"
+        )
+
+    with col2:
+        t_max = st.number_input(
+            "End Time", value=5.0, step=0.1, format="%.5f", key=f"{key_prefix}_t1"
+        )
+
+    with col3:
+        fs = st.number_input(
+            "Sampling Frequency (Hz)",
+            min_value=1,
+            max_value=50000,
+            value=1000,
+            step=100,
+            key=f"{key_prefix}_fs",
+        )
+
+    return signal_type, t_min, t_max, fs
+
+
+def run_fourier_transform_module():
+    st.markdown("## Fourier Transform")
+    st.markdown(
+        "**Definition:** $X(f) = \\int_{-\\infty}^{\\infty} x(t) e^{-j2\\pi ft} dt$, "
+        "shown for $f \\ge 0$ (real signals have $X(-f) = X^*(f)$)."
+    )
+
+    signal_type, t_min, t_max, fs = _signal_inputs("ft")
+    if t_min >= t_max:
+        st.warning("Start time must be less than end time.")
+        return
+
+    time = TimeAxis(t_min=t_min, t_max=t_max, dt=1 / fs)
+    t = signal_cache.time_axis(time)
+
+    signal = build_signal_ui(signal_type, key_prefix="ft")
+    x = signal_cache.evaluate(signal, time)
+
+    with profile_stage("spectrum"):
+        spec = spectrum(x, 1.0 / time.step, t0=time.start)
+
+    f_max = st.number_input(
+        "Max Frequency (Hz)",
+        min_value=0.1,
+        max_value=fs / 2,
+        value=min(10.0, fs / 2),
+        step=1.0,
+        key="ft_f_max",
+    )
+
+    st.markdown("-----")
+
+    # Time signal
+    # --------------------------------
+    fig = plot_signal(t, x, title=f"x(t) = {signal.formula}")
+    with profile_stage("plotly_chart"):
+        st.plotly_chart(fig, use_container_width=True, key="ft_time_plot")
+
+    # Magnitude and phase
+    # --------------------------------
+    col_left, col_right = st.columns(2)
+    with col_left:
+        fig = plot_signal(
+            spec.freqs,
+            spec.magnitude,
+            title="Magnitude Spectrum |X(f)|",
+            xlim=(0.0, f_max),
+            autoscale=False,
+            xaxis_title="Frequency (Hz)",
+            yaxis_title="|X(f)|",
+        )
+        with profile_stage("plotly_chart"):
+            st.plotly_chart(fig, use_container_width=True, key="ft_magnitude_plot")
+
+    with col_right:
+        fig = plot_signal(
+            spec.freqs,
+            spec.phase(),
+            title="Phase Spectrum ∠X(f)",
+            xlim=(0.0, f_max),
+            autoscale=False,
+            xaxis_title="Frequency (Hz)",
+            yaxis_title="Phase (rad)",
+        )
+        with profile_stage("plotly_chart"):
+            st.plotly_chart(fig, use_container_width=True, key="ft_phase_plot")
+
+    st.caption(
+        f"{spec.n_fft:,}-point real FFT of {len(time):,} samples "
+        f"(resolution {fs / spec.n_fft:.4g} Hz)"
+    )
+
+
+def run_power_spectrum_module():
+    st.markdown("## Power Spectral Density")
+    st.markdown(
+        "Welch's method averages the periodograms of overlapping, windowed "
+        "segments: longer segments resolve finer detail, shorter ones average "
+        "more segments and give a smoother estimate."
+    )
+
+    signal_type, t_min, t_max, fs = _signal_inputs("psd")
+    if t_min >= t_max:
+        st.warning("Start time must be less than end time.")
+        return
+
+    time = TimeAxis(t_min=t_min, t_max=t_max, dt=1 / fs)
+    signal = build_signal_ui(signal_type, key_prefix="psd")
+
+    col_a, col_b = st.columns(2)
+    with col_a:
+        nperseg = st.select_slider(
+            "Segment Length (samples)",
+            options=[64, 128, 256, 512, 1024, 2048, 4096],
+            value=256,
+            key="psd_nperseg",
+        )
+    with col_b:
+        f_max = st.number_input(
+            "Max Frequency (Hz)",
+            min_value=0.1,
+            max_value=fs / 2,
+            value=min(10.0, fs / 2),
+            step=1.0,
+            key="psd_f_max",
+        )
+
+    # Streamed over the axis in chunks; never materializes all samples
+    with profile_stage("psd"):
+        psd = signal.psd(time, nperseg=nperseg)
+
+    st.markdown("-----")
+
+    fig = plot_signal(
+        psd.freqs,
+        psd.values,
+        title=f"PSD of {signal.formula}",
+        xlim=(0.0, f_max),
+        autoscale=False,
+        xaxis_title="Frequency (Hz)",
+        yaxis_title="PSD (units²/Hz)",
+    )
+    with profile_stage("plotly_chart"):
+        st.plotly_chart(fig, use_container_width=True, key="psd_plot")
+
+    bandwidth = psd.occupied_bandwidth(0.99)
+    st.caption(
+        f"99% of the power lies below {bandwidth:.4g} Hz "
+        f"(resolution {fs / psd.n_fft:.4g} Hz)"
+    )
@@ -0,0 +1,114 @@
+import importlib
+import threading
+import time
+
+# Sidebar sections and their lessons: title -> (module, entry point).
+# None marks a lesson that is listed but not implemented yet.
+PAGES = {
+    "Signal Analysis": {
+        "Signal Fundamentals": ("src.modules.signals", "run_signals_module"),
+        "Basic Signal Operations": (
+            "src.modules.basic_operations",
+            "run_basic_operations_module",
+        ),
+        "Energy and Power Signals": (
+            "src.modules.energy_power_signals",
+            "run_energy_power_module",
+        ),
+        "Convolution": ("src.modules.convolution", "run_convolution_module"),
+    },
+    "Frequency Domain": {
+        "Fourier Transform": (
+            "src.modules.frequency_domain",
+            "run_fourier_transform_module",
+        ),
+        "Power Spectrum": (
+            "src.modules.frequency_domain",
+            "run_power_spectrum_module",
+        ),
+        "Filtering": ("src.modules.filtering", "run_filtering_module"),
+    },
+    "Digital Communication": {
+        "Sampling Theorem": None,
+        "Digital Modulation": (
+            "src.modules.digital_modulation",
+            "run_digital_modulation_module",
+        ),
+    },
+    "Channel & Noise": {
+        "BER vs SNR": ("src.modules.channel_noise", "run_ber_module"),
+    },
+}
+
+# Third-party imports every page needs; warmed after the first page is shown
+HEAVY_IMPORTS = (
+    "numpy",
+    "scipy.fft",
+    "scipy.signal",
+    "scipy.special",
+    "plotly.graph_objects",
+)
+
+# Seconds spent importing each module through this registry, in load order.
+# Modules already imported elsewhere cost ~0 and show up as such.
+IMPORT_TIMES = {}
+
+_loaded = {}
+_lock = threading.Lock()
+_warm_thread = None
+
+
+def _timed_import(name):
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    with _lock:
+        IMPORT_TIMES.setdefault(name, time.perf_counter() - start)
+    return module
+
+
+def load_page(section, title):
+    """
+    Return the run function of a lesson, importing its module on first use.
+
+    Returns None for lessons that are listed but not implemented.
+    """
+    target = PAGES[section][title]
+    if target is None:
+        return None
+
+    if target not in _loaded:
+        module_name, function_name = target
+        _loaded[target] = getattr(_timed_import(module_name), function_name)
+    return _loaded[target]
+
+
+def warm_imports_in_background():
+    """
+    Import the heavy dependencies and the remaining lesson modules in a
+    daemon thread, once per process, so later page switches are instant.
+    """
+    global _warm_thread
+
+    with _lock:
+        if _warm_thread is not None:
+            return
+        names = list(HEAVY_IMPORTS)
+        for lessons in PAGES.values():
+            names.extend(target[0] for target in lessons.values() if target)
+        _warm_thread = threading.Thread(
+            target=lambda: [_timed_import(name) for name in names],
+            name="commviz-import-warmup",
+            daemon=True,
+        )
+
+    _warm_thread.start()
+
+
+def import_report():
+    """Import times in milliseconds, slowest first"""
+    with _lock:
+        items = list(IMPORT_TIMES.items())
+    return [
+        {"module": name, "ms": seconds * 1e3}
+        for name, seconds in sorted(items, key=lambda item: item[1], reverse=True)
+    ]
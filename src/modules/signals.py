@@ -2,9 +2,12 @@ import numpy as np
 import streamlit as st
 
 # Project Imports
+from src.core.cache import signal_cache
 from src.core.signals import get_available_signals, get_signal_modes
 from src.ui.build_signals import build_signal_ui
+from src.ui.notices import show_clamp_notice
 from src.ui.plots import plot_signal
+from src.utils.profiler import profile_stage
 from src.utils.time_axis import TimeAxis
 
 
@@ -47,7 +50,9 @@ def run_signals_module():
     # Time Axis Generation
     # --------------------------------
     time = TimeAxis(t_min=t_min, t_max=t_max, dt=1 / fs, signal_mode=signal_mode)
-    t = time.generate()
+    t = signal_cache.time_axis(time)
+
+    show_clamp_notice(time)
 
     # Signal Construction
     # --------------------------------
@@ -55,7 +60,7 @@ def run_signals_module():
 
     # Evaluation
     # --------------------------------
-    y = signal.evaluate(t)
+    y = signal_cache.evaluate(signal, time)
 
     st.markdown("-----")
 
@@ -117,4 +122,9 @@ def run_signals_module():
             enable_zero_line=enable_zero_line,
             show_grid=show_grid,
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with profile_stage("plotly_chart"):
+            st.plotly_chart(fig, use_container_width=True)
+        st.caption(
+            f"Rendering {fig.layout.meta['points_rendered']:,} of "
+            f"{fig.layout.meta['points_original']:,} samples"
+        )
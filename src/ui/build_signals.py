@@ -12,8 +12,10 @@ from src.core.signals import (
     unit_impulse,
     unit_step,
 )
+from src.utils.profiler import profiled
 
 
+@profiled("build_signal_ui")
 def build_signal_ui(signal_type: str, key_prefix: str = ""):
     """
     Reusable UI component for building signals.
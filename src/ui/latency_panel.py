@@ -0,0 +1,53 @@
+import os
+from collections import deque
+
+import streamlit as st
+
+# Number of rerun traces kept per session for download
+TRACE_HISTORY = 100
+
+# If set, every rerun trace is appended to this file as one JSON line
+TRACE_FILE_ENV = "COMMVIZ_TRACE_FILE"
+
+
+def record_trace(profiler):
+    """Keep the rerun's trace in the session history and the trace file"""
+    history = st.session_state.setdefault(
+        "profiler_traces", deque(maxlen=TRACE_HISTORY)
+    )
+    line = profiler.to_json_line()
+    history.append(line)
+
+    path = os.environ.get(TRACE_FILE_ENV)
+    if path:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def render_latency_panel(profiler, imports=()):
+    """
+    Collapsible per-stage latency breakdown of the last rerun in the sidebar,
+    followed by the import times of lazily loaded modules (see registry).
+    """
+    with st.sidebar.expander("Latency breakdown", expanded=False):
+        st.caption(f"{profiler.page}: {profiler.wall_time * 1e3:.1f} ms total")
+
+        rows = profiler.summary()
+        if not profiler.track_memory:
+            for row in rows:
+                row.pop("bytes")
+        if rows:
+            st.dataframe(rows, hide_index=True, use_container_width=True)
+
+        if imports:
+            st.caption("Import times")
+            st.dataframe(list(imports), hide_index=True, use_container_width=True)
+
+        history = st.session_state.get("profiler_traces", ())
+        st.download_button(
+            "Download traces (JSON lines)",
+            data="\n".join(history) + "\n",
+            file_name="commviz_traces.jsonl",
+            mime="application/jsonl",
+            disabled=not history,
+        )
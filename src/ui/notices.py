@@ -0,0 +1,10 @@
+import streamlit as st
+
+
+def show_clamp_notice(time):
+    """Explain when Discrete mode clamped the axis (TimeAxis.is_clamped)"""
+    if time.is_clamped:
+        st.caption(
+            f"Discrete mode is limited to {time.n} samples "
+            f"(spacing {time.step:.4g} s instead of {time.dt:.4g} s)."
+        )
@@ -1,6 +1,141 @@
+import functools
+
+import numpy as np
 import plotly.graph_objects as go
+import plotly.io as pio
+
+from src.utils.decimation import decimate, visible_slice
+from src.utils.profiler import profiled
+
+# Traces whose visible window holds more than this many points before
+# decimation are drawn with WebGL (Scattergl). Decimated traces stay near
+# max_points, so counting after decimation would never reach it.
+WEBGL_THRESHOLD = 5000
+
+# Time values are sent as float32 only while rounding stays far below a
+# pixel: float32 spacing near |t| must be under this fraction of the span.
+_FLOAT32_TIME_RESOLUTION = 1e-5
+
+_FLOAT32_MAX = float(np.finfo(np.float32).max)
+
+
+def _payload(values, span=None):
+    """
+    Array to hand to plotly. Plotly serialises NumPy arrays as base64 typed
+    arrays, so float32 halves the payload. Values stay float64 when float32
+    would overflow them to inf, and time values also when float32 would
+    blur them (e.g. a short window far from t = 0).
+    """
+    values = np.asarray(values)
+    finite = np.abs(values[np.isfinite(values)])
+    if finite.size:
+        largest = float(finite.max())
+        if largest > _FLOAT32_MAX:
+            # Would overflow to inf
+            return values.astype(np.float64, copy=False)
+        if (
+            span is not None
+            and np.spacing(np.float32(largest)) > span * _FLOAT32_TIME_RESOLUTION
+        ):
+            return values.astype(np.float64, copy=False)
+    return values.astype(np.float32, copy=False)
+
 
+# plot_signal draws plain 2-D line and marker traces, so only the layout
+# part of the plotly_white template matters (its trace defaults set fill
+# patterns and colorbars), minus subplot types it never creates. Validating
+# the full template costs ~15 ms per figure.
+_TEMPLATE_UNUSED_LAYOUT = (
+    "coloraxis",
+    "colorscale",
+    "geo",
+    "polar",
+    "scene",
+    "ternary",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _template():
+    """The plotly_white template, reduced to what plot_signal's figures use"""
+    layout = pio.templates["plotly_white"].to_plotly_json()["layout"]
+    return dict(
+        layout={k: v for k, v in layout.items() if k not in _TEMPLATE_UNUSED_LAYOUT}
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _figure_skeleton(
+    discrete,
+    color,
+    use_webgl,
+    height,
+    show_grid,
+    enable_zero_line,
+    xaxis_title,
+    yaxis_title,
+    log_y,
+):
+    """
+    Validated plotly JSON of an empty figure: trace styling and the full
+    layout, without data, ranges, title text or metadata.
+
+    Built once per configuration; callers must copy what they modify.
+    """
+    Trace = go.Scattergl if use_webgl else go.Scatter
+    fig = go.Figure()
 
+    if discrete:
+        # Stem lines (NaN-separated) and the markers on top of them
+        fig.add_trace(
+            Trace(
+                mode="lines",
+                line=dict(color=color, width=2),
+                connectgaps=False,
+                hoverinfo="skip",
+                showlegend=False,
+            )
+        )
+        fig.add_trace(
+            Trace(
+                mode="markers",
+                marker=dict(color=color, size=8),
+                showlegend=False,
+            )
+        )
+    else:
+        fig.add_trace(
+            Trace(
+                mode="lines",
+                name="Signal",
+                line=dict(color=color, width=2),
+            )
+        )
+
+    axis = dict(
+        showline=True,
+        linewidth=1,
+        showgrid=show_grid,
+        gridcolor="lightgray",
+        gridwidth=1,
+        zeroline=enable_zero_line,
+        zerolinecolor="red",
+        zerolinewidth=1,
+    )
+    fig.update_layout(
+        xaxis_title=xaxis_title,
+        yaxis_title=yaxis_title,
+        template=_template(),
+        height=height,
+        margin=dict(l=10, r=10, t=40, b=40),
+        xaxis=axis,
+        yaxis=dict(axis, type="log") if log_y else axis,
+    )
+
+    return fig.to_plotly_json()
+
+
+@profiled("plot_signal")
 def plot_signal(
     t,
     x,
@@ -14,83 +149,116 @@ def plot_signal(
     height=400,
     show_grid=True,
     enable_zero_line=False,
+    max_points=2000,  # ~ plot width in pixels; None disables decimation
+    decimation="minmax",  # "minmax" or "lttb"
+    webgl_threshold=WEBGL_THRESHOLD,  # None keeps SVG traces
+    xaxis_title="Time",
+    yaxis_title="Amplitude",
+    log_y=False,  # logarithmic y axis (non-positive values are not drawn)
 ):
-    fig = go.Figure()
+    t = np.asarray(t)
+    x = np.asarray(x)
+    n_original = len(t)
+
+    # Decimation
+    # ----------------------------
+    # Only the visible window is reduced, so a narrower xlim re-decimates at
+    # a finer resolution instead of zooming into a coarse trace.
+    t_plot, x_plot = t, x
+    window = visible_slice(t, None if autoscale else xlim)
+    n_visible = window.stop - window.start
+    if max_points is not None:
+        t_plot, x_plot = decimate(
+            t,
+            x,
+            max_points=max_points,
+            method=decimation,
+            xlim=None if autoscale else xlim,
+        )
+
+    # Trace Encoding
+    # ----------------------------
+    # Stems send three points per sample
+    n_points = n_visible * (3 if discrete else 1)
+    use_webgl = webgl_threshold is not None and n_points > webgl_threshold
+
+    t_span = float(np.nanmax(t_plot) - np.nanmin(t_plot)) if len(t_plot) else 0.0
+    t_plot = _payload(t_plot, span=t_span)
+    x_plot = _payload(x_plot)
 
     # Plot Type
     # ----------------------------
     if discrete:
-        # Stem plot
-        for xi, ti in zip(x, t):
-            fig.add_trace(
-                go.Scatter(
-                    x=[ti, ti],
-                    y=[0, xi],
-                    mode="lines+markers",
-                    marker=dict(color=color, size=8),
-                    line=dict(color=color, width=2),
-                    showlegend=False,
-                )
-            )
+        # Stem plot: every stem is (t, 0) -> (t, x) followed by a NaN break,
+        # so all stems fit in one line trace plus one marker trace.
+        n = len(t_plot)
+        stem_t = np.empty(3 * n, dtype=t_plot.dtype)
+        stem_t[0::3] = t_plot
+        stem_t[1::3] = t_plot
+        stem_t[2::3] = np.nan
+
+        stem_x = np.empty(3 * n, dtype=x_plot.dtype)
+        stem_x[0::3] = 0.0
+        stem_x[1::3] = x_plot
+        stem_x[2::3] = np.nan
+
+        trace_data = [(stem_t, stem_x), (t_plot, x_plot)]
     else:
-        fig.add_trace(
-            go.Scatter(
-                x=t,
-                y=x,
-                mode="lines",
-                name="Signal",
-                line=dict(color=color, width=2),
-            )
-        )
+        trace_data = [(t_plot, x_plot)]
 
     # Axis Limits
     # ----------------------------
     if autoscale:
-        xmin, xmax = min(t), max(t)
-        ymin, ymax = min(x), max(x)
+        xmin, xmax = np.nanmin(t), np.nanmax(t)
+        y_values = x
+        if log_y:
+            # Log axes take their range in decades of the positive values
+            y_values = np.log10(x[x > 0]) if np.any(x > 0) else np.zeros(1)
+        ymin, ymax = np.nanmin(y_values), np.nanmax(y_values)
 
         # Padding
         dx = (xmax - xmin) * padding
         dy = (ymax - ymin) * padding if ymax != ymin else 1
 
-        x_range = [xmin - dx, xmax + dx]
-        y_range = [ymin - dy, ymax + dy]
+        x_range = [float(xmin - dx), float(xmax + dx)]
+        y_range = [float(ymin - dy), float(ymax + dy)]
 
     else:
         x_range = list(xlim) if xlim else None
         y_range = list(ylim) if ylim else None
+        if y_range is not None and log_y:
+            y_range = [float(np.log10(limit)) for limit in y_range]
 
     # Layout
     # ----------------------------
-    fig.update_layout(
-        title=title,
-        xaxis_title="Time",
-        yaxis_title="Amplitude",
-        template="plotly_white",
-        height=height,
-        margin=dict(l=10, r=10, t=40, b=40),
-        xaxis=dict(
-            range=x_range,
-            showline=True,
-            linewidth=1,
-            showgrid=show_grid,
-            gridcolor="lightgray",
-            gridwidth=1,
-            zeroline=enable_zero_line,
-            zerolinecolor="red",
-            zerolinewidth=1,
-        ),
-        yaxis=dict(
-            range=y_range,
-            showline=True,
-            linewidth=1,
-            showgrid=show_grid,
-            gridcolor="lightgray",
-            gridwidth=1,
-            zeroline=enable_zero_line,
-            zerolinecolor="red",
-            zerolinewidth=1,
-        ),
+    # Only data, ranges, title and metadata differ from the cached skeleton;
+    # nested dicts that change are copied, the rest is shared.
+    skeleton = _figure_skeleton(
+        discrete,
+        color,
+        use_webgl,
+        height,
+        show_grid,
+        enable_zero_line,
+        xaxis_title,
+        yaxis_title,
+        log_y,
+    )
+    layout = dict(skeleton["layout"])
+    layout["title"] = dict(layout.get("title", {}), text=title)
+    for name, axis_range in (("xaxis", x_range), ("yaxis", y_range)):
+        if axis_range is not None:
+            layout[name] = dict(layout[name], range=axis_range)
+    layout["meta"] = dict(
+        points_original=n_original,
+        points_rendered=len(t_plot),
+        renderer="webgl" if use_webgl else "svg",
+        encoding=f"{t_plot.dtype}/{x_plot.dtype}",
     )
+    data = [
+        dict(trace, x=xs, y=ys) for trace, (xs, ys) in zip(skeleton["data"], trace_data)
+    ]
 
-    return fig
+    # Validation builds new plotly objects from these dicts, so figures
+    # never share state with the cached skeleton
+    return go.Figure(data=data, layout=layout)
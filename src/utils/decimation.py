@@ -0,0 +1,133 @@
+import numpy as np
+
+DECIMATION_METHODS = ("minmax", "lttb")
+
+
+def visible_slice(t, xlim):
+    """
+    Index range of `t` (sorted ascending) that falls inside xlim.
+
+    One extra sample is kept on each side so lines still reach the plot edges.
+    """
+    if xlim is None:
+        return slice(0, len(t))
+
+    lo = np.searchsorted(t, xlim[0], side="left")
+    hi = np.searchsorted(t, xlim[1], side="right")
+    return slice(max(lo - 1, 0), min(hi + 1, len(t)))
+
+
+def minmax_indices(x, n_buckets):
+    """
+    Indices of the minimum and maximum of each of n_buckets equal buckets.
+
+    Both extremes of every bucket are kept, in time order, so peaks and
+    single-sample impulses survive decimation. NaN samples are ignored
+    unless a bucket holds nothing else; then one of them is kept, so the
+    gap still shows in the plot.
+    """
+    n = len(x)
+    if n_buckets <= 0 or 2 * n_buckets >= n:
+        return np.arange(n)
+
+    x = np.asarray(x)
+    x_low = x_high = x
+    missing = np.isnan(x)
+    if missing.any():
+        # NaN never wins a comparison this way, unlike in argmin/argmax
+        x_low = np.where(missing, np.inf, x)
+        x_high = np.where(missing, -np.inf, x)
+
+    bucket = -(-n // n_buckets)  # ceil
+    n_full = n // bucket
+    split = n_full * bucket
+
+    offsets = np.arange(n_full) * bucket
+    i_min = offsets + np.argmin(x_low[:split].reshape(n_full, bucket), axis=1)
+    i_max = offsets + np.argmax(x_high[:split].reshape(n_full, bucket), axis=1)
+
+    if split < n:
+        i_min = np.append(i_min, split + np.argmin(x_low[split:]))
+        i_max = np.append(i_max, split + np.argmax(x_high[split:]))
+
+    idx = np.sort(np.stack([i_min, i_max], axis=1), axis=1).reshape(-1)
+
+    # Always keep the end points, drop duplicates (flat buckets)
+    idx = np.concatenate(([0], idx, [n - 1]))
+    keep = np.ones(idx.size, dtype=bool)
+    keep[1:] = idx[1:] != idx[:-1]
+    return idx[keep]
+
+
+def lttb_indices(t, x, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last sample and, for each inner bucket, the sample
+    that forms the largest triangle with the previously kept sample and the
+    mean of the next bucket.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    t = np.asarray(t, dtype=float)
+    x = np.asarray(x, dtype=float)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    idx = np.empty(n_out, dtype=int)
+    idx[0] = 0
+    idx[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt_lo, nxt_hi = hi, edges[i + 2] if i + 2 < n_out - 1 else n
+        t_avg = t[nxt_lo:nxt_hi].mean()
+        x_avg = x[nxt_lo:nxt_hi].mean()
+
+        area = np.abs(
+            (t[a] - t_avg) * (x[lo:hi] - x[a]) - (t[a] - t[lo:hi]) * (x_avg - x[a])
+        )
+        a = lo + int(np.argmax(area))
+        idx[i + 1] = a
+
+    return idx
+
+
+def decimate(t, x, max_points=2000, method="minmax", xlim=None):
+    """
+    Reduce a trace to roughly max_points samples for plotting.
+
+    Parameters:
+        t, x : array-like
+            Sorted time axis and samples
+        max_points : int
+            Target number of rendered points (about the plot's pixel width)
+        method : str
+            "minmax" (min and max per bucket) or "lttb"
+        xlim : (xmin, xmax), optional
+            Visible range; decimation is done over this window only, so
+            zooming in recomputes at the finer resolution.
+
+    Returns:
+        t_out, x_out : ndarray
+    """
+    if method not in DECIMATION_METHODS:
+        raise ValueError(f"method must be one of {DECIMATION_METHODS}, got {method!r}")
+
+    t = np.asarray(t)
+    x = np.asarray(x)
+
+    window = visible_slice(t, xlim)
+    t, x = t[window], x[window]
+
+    if len(x) <= max_points:
+        return t, x
+
+    if method == "minmax":
+        idx = minmax_indices(x, max_points // 2)
+    else:
+        idx = lttb_indices(t, x, max_points)
+
+    return t[idx], x[idx]
@@ -0,0 +1,166 @@
+import functools
+import inspect
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Profiler of the rerun currently executing in this thread/context, if any
+_active_profiler = ContextVar("active_profiler", default=None)
+
+
+class StageRecord:
+    """Wall time, allocations and array sizes of one instrumented stage"""
+
+    def __init__(self, name):
+        self.name = name
+        self.wall_time = 0.0  # seconds
+        self.allocated_bytes = None  # peak traced allocation, if tracked
+        self.arrays = {}  # label -> {"shape": ..., "nbytes": ...}
+
+    def array(self, label, value):
+        """Record the shape and size of an array produced or consumed here"""
+        # Duck-typed so that importing the profiler does not import NumPy
+        if hasattr(value, "shape") and hasattr(value, "nbytes"):
+            self.arrays[label] = {"shape": list(value.shape), "nbytes": value.nbytes}
+        return value
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "wall_time": self.wall_time,
+            "allocated_bytes": self.allocated_bytes,
+            "arrays": self.arrays,
+        }
+
+
+class RerunProfiler:
+    """
+    Collects StageRecords for a single Streamlit rerun.
+
+    Use activate() around the page code; profile_stage() and @profiled then
+    record into this profiler. With track_memory=True allocations are
+    measured with tracemalloc (NumPy reports its buffers to it), which
+    slows the rerun down, so it is opt-in. Memory figures of nested stages
+    are only reliable for the innermost stage.
+    """
+
+    def __init__(self, page, track_memory=False):
+        self.page = page
+        self.track_memory = track_memory
+        self.stages = []
+        self.started_at = time.time()
+        self.wall_time = 0.0
+
+    @contextmanager
+    def activate(self):
+        token = _active_profiler.set(self)
+        started_tracing = self.track_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.wall_time = time.perf_counter() - start
+            if started_tracing:
+                tracemalloc.stop()
+            _active_profiler.reset(token)
+
+    @contextmanager
+    def stage(self, name):
+        record = StageRecord(name)
+        tracking = self.track_memory and tracemalloc.is_tracing()
+        if tracking:
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.wall_time = time.perf_counter() - start
+            if tracking:
+                _, peak = tracemalloc.get_traced_memory()
+                record.allocated_bytes = max(peak - baseline, 0)
+            self.stages.append(record)
+
+    def summary(self):
+        """Total wall time and call count per stage name, slowest first"""
+        totals = {}
+        for record in self.stages:
+            entry = totals.setdefault(
+                record.name, {"stage": record.name, "calls": 0, "ms": 0.0, "bytes": 0}
+            )
+            entry["calls"] += 1
+            entry["ms"] += record.wall_time * 1e3
+            entry["bytes"] += record.allocated_bytes or 0
+        return sorted(totals.values(), key=lambda entry: entry["ms"], reverse=True)
+
+    def to_dict(self):
+        return {
+            "page": self.page,
+            "started_at": self.started_at,
+            "wall_time": self.wall_time,
+            "track_memory": self.track_memory,
+            "stages": [record.to_dict() for record in self.stages],
+        }
+
+    def to_json_line(self):
+        return json.dumps(self.to_dict())
+
+
+class _NullStage:
+    """Stand-in record used when no profiler is active"""
+
+    def array(self, label, value):
+        return value
+
+
+_NULL_STAGE = _NullStage()
+
+
+@contextmanager
+def profile_stage(name):
+    """Time a block as stage `name` of the active profiler (no-op without one)"""
+    profiler = _active_profiler.get()
+    if profiler is None:
+        yield _NULL_STAGE
+        return
+
+    with profiler.stage(name) as record:
+        yield record
+
+
+def profiled(name):
+    """
+    Decorator form of profile_stage. NumPy array arguments and return
+    values are recorded by parameter name ("return" for the result).
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active_profiler.get() is None:
+                return func(*args, **kwargs)
+
+            with profile_stage(name) as record:
+                bound = signature.bind_partial(*args, **kwargs)
+                for label, value in bound.arguments.items():
+                    record.array(label, value)
+
+                result = func(*args, **kwargs)
+
+                values = result if isinstance(result, tuple) else (result,)
+                for index, value in enumerate(values):
+                    label = "return" if len(values) == 1 else f"return[{index}]"
+                    record.array(label, value)
+                return result
+
+        return wrapper
+
+    return decorator
@@ -1,22 +1,163 @@
 import numpy as np
 
+# Discrete mode draws one stem per sample; more than this is unreadable.
+DISCRETE_MAX_POINTS = 500
+DISCRETE_MIN_POINTS = 10
+
 
 class TimeAxis:
-    """Time Engine"""
+    """
+    Time Engine
+
+    A virtual, uniformly spaced axis t[i] = start + i * step for 0 <= i < n.
+    Length, indexing, chunking and slicing are O(1); samples are only
+    materialized by generate() (or np.asarray(axis)), and every sample is
+    computed from its index, so there is no accumulated drift as with arange.
+    """
 
-    def __init__(self, t_min=-5.0, t_max=5.0, dt=0.001, signal_mode="Continuous"):
+    def __init__(
+        self,
+        t_min=-5.0,
+        t_max=5.0,
+        dt=0.001,
+        signal_mode="Continuous",
+        max_points=DISCRETE_MAX_POINTS,
+    ):
         self.t_min = t_min
         self.t_max = t_max
         self.dt = dt
         self.signal_mode = signal_mode
+        self.max_points = max_points  # Discrete mode only, None disables
+        self._fixed_layout = None
+
+    @classmethod
+    def from_samples(cls, start, step, n, signal_mode="Continuous"):
+        """Axis of exactly n samples start, start + step, ..."""
+        return cls._sub_axis((float(start), float(step), 0, 1, int(n)), signal_mode)
+
+    @classmethod
+    def _sub_axis(cls, grid, signal_mode):
+        origin, base_step, offset, stride, n = grid
+        start = origin + offset * base_step
+        step = base_step * stride
+        axis = cls(start, start + step * max(n - 1, 0), step, signal_mode)
+        axis._fixed_layout = grid
+        return axis
+
+    # -------- Layout --------
+    def _grid(self):
+        """
+        Layout as (origin, base_step, offset, stride, n), where
+        t[i] = origin + (offset + i * stride) * base_step.
+
+        Sub-axes keep their parent's origin and base step so their samples
+        are bit-identical to the parent's.
+        """
+        if self._fixed_layout is not None:
+            return self._fixed_layout
+
+        span = self.t_max - self.t_min
 
-    def generate(self):
         if self.signal_mode == "Discrete":
-            num_points = int((self.t_max - self.t_min) / self.dt)
-            num_points = min(max(num_points, 10), 500)  # clamp
-            return np.linspace(self.t_min, self.t_max, num_points)
+            n = max(int(span / self.dt), DISCRETE_MIN_POINTS)
+            if self.max_points is not None:
+                n = min(n, self.max_points)
+            return float(self.t_min), span / (n - 1), 0, 1, n
+
+        # Relative tolerance so t_max is kept when span / dt is integral up to
+        # rounding (e.g. 10 / 0.001 = 9999.999999999998)
+        ratio = span / self.dt
+        n = int(np.floor(ratio + max(abs(ratio), 1.0) * 1e-12)) + 1
+        return float(self.t_min), float(self.dt), 0, 1, max(n, 1)
+
+    def _layout(self):
+        """(start, step, n)"""
+        origin, base_step, offset, stride, n = self._grid()
+        return origin + offset * base_step, base_step * stride, n
+
+    @property
+    def start(self):
+        return self._layout()[0]
+
+    @property
+    def step(self):
+        return self._layout()[1]
+
+    @property
+    def n(self):
+        return self._grid()[4]
+
+    @property
+    def stop(self):
+        """Last sample time"""
+        return self[-1] if self.n else self.start
+
+    @property
+    def is_clamped(self):
+        """True if Discrete mode reduced the number of samples to max_points"""
+        if self.signal_mode != "Discrete" or self.max_points is None:
+            return False
+        return int((self.t_max - self.t_min) / self.dt) > self.max_points
+
+    @property
+    def key(self):
+        """Hashable identity of the generated grid"""
+        return self._grid()
+
+    # -------- Sequence protocol --------
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, index):
+        origin, base_step, offset, stride, n = self._grid()
+
+        if isinstance(index, slice):
+            first, last, step = index.indices(n)
+            count = len(range(first, last, step))
+            grid = (origin, base_step, offset + first * stride, stride * step, count)
+            return TimeAxis._sub_axis(grid, self.signal_mode)
+
+        index = int(index)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError(f"index {index} out of range for {n} samples")
+        return origin + (offset + index * stride) * base_step
+
+    def __array__(self, dtype=None, copy=None):
+        t = self.generate()
+        return t if dtype is None else t.astype(dtype, copy=False)
+
+    def __repr__(self):
+        start, step, n = self._layout()
+        return f"TimeAxis(start={start!r}, step={step!r}, n={n})"
+
+    # -------- Materialization --------
+    def generate(self):
+        origin, base_step, offset, stride, n = self._grid()
+        return origin + base_step * np.arange(offset, offset + n * stride, stride)
+
+    def iter_chunks(self, size):
+        """Yield consecutive sub-axes of at most `size` samples"""
+        if size < 1:
+            raise ValueError("chunk size must be at least 1")
+
+        for first in range(0, self.n, size):
+            yield self[first : first + size]
+
+    def slice_time(self, t_start=None, t_stop=None):
+        """Sub-axis of the samples with t_start <= t <= t_stop"""
+        start, step, n = self._layout()
+
+        first = 0
+        if t_start is not None:
+            first = int(np.ceil((t_start - start) / step - 1e-9))
+        last = n - 1
+        if t_stop is not None:
+            last = int(np.floor((t_stop - start) / step + 1e-9))
 
-        return np.arange(self.t_min, self.t_max + self.dt, self.dt)
+        first, last = max(first, 0), min(last, n - 1)
+        return self[first : max(last + 1, first)]
 
     def update(self, t_min=None, t_max=None, dt=None):
         if t_min is not None:
@@ -25,3 +166,4 @@ class TimeAxis:
             self.t_max = t_max
         if dt is not None:
             self.dt = dt
+        self._fixed_layout = None